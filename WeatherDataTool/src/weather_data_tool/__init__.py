@@ -11,7 +11,7 @@ __author__ = "WeatherDataTool Contributors"
 from weather_data_tool.download import get_provider
 from weather_data_tool.regrid import regrid_dataset, create_reference_grid
 from weather_data_tool.analyze import compute_ensemble_spread, create_spread_map
-from weather_data_tool.io import save_dataset, load_dataset, spatial_subset
+from weather_data_tool.io import save_dataset, load_dataset, load_ensemble, spatial_subset
 
 __all__ = [
     "get_provider",
@@ -21,5 +21,6 @@ __all__ = [
     "create_spread_map",
     "save_dataset",
     "load_dataset",
+    "load_ensemble",
     "spatial_subset",
 ]
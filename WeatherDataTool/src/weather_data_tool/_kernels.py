@@ -0,0 +1,129 @@
+"""Numba kernels for ensemble statistics (only defined when Numba is installed)."""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Try to import numba for parallel kernels, but make it optional
+try:
+    from numba import njit, prange
+    from numba.typed import List as NumbaList  # noqa: F401
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.debug("Numba not available. Ensemble statistics will use numpy.")
+    NUMBA_AVAILABLE = False
+
+# Grid points handled per parallel task: large enough to amortize scheduling,
+# small enough that a block of every model stays in cache
+KERNEL_BLOCK_SIZE = 4096
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def welford_kernel(arrays, block_size=KERNEL_BLOCK_SIZE):
+        """
+        Parallel Welford mean and population std dev over a list of 1D arrays.
+
+        Threads work on disjoint blocks of grid points; within a block the
+        models are streamed in order so each input is read once and
+        contiguously. NaNs are skipped per grid point.
+        """
+        n_models = len(arrays)
+        n_points = arrays[0].size
+        mean = np.zeros(n_points)
+        m2 = np.zeros(n_points)
+        count = np.zeros(n_points, dtype=np.int64)
+        n_blocks = (n_points + block_size - 1) // block_size
+
+        for block in prange(n_blocks):
+            start = block * block_size
+            stop = min(start + block_size, n_points)
+            for k in range(n_models):
+                member = arrays[k]
+                for p in range(start, stop):
+                    x = member[p]
+                    if np.isnan(x):
+                        continue
+                    count[p] += 1
+                    delta = x - mean[p]
+                    mean[p] += delta / count[p]
+                    m2[p] += delta * (x - mean[p])
+
+            for p in range(start, stop):
+                if count[p] == 0:
+                    mean[p] = np.nan
+                    m2[p] = np.nan
+                else:
+                    m2[p] = np.sqrt(m2[p] / count[p])
+
+        return mean, m2
+
+    @njit(parallel=True, cache=True)
+    def welford_stacked_kernel(values, block_size=KERNEL_BLOCK_SIZE):
+        """
+        Same as welford_kernel for a contiguous (model, point) 2D array.
+
+        Avoids building a typed list when the ensemble is already stacked.
+        """
+        n_models, n_points = values.shape
+        mean = np.zeros(n_points)
+        m2 = np.zeros(n_points)
+        count = np.zeros(n_points, dtype=np.int64)
+        n_blocks = (n_points + block_size - 1) // block_size
+
+        for block in prange(n_blocks):
+            start = block * block_size
+            stop = min(start + block_size, n_points)
+            for k in range(n_models):
+                for p in range(start, stop):
+                    x = values[k, p]
+                    if np.isnan(x):
+                        continue
+                    count[p] += 1
+                    delta = x - mean[p]
+                    mean[p] += delta / count[p]
+                    m2[p] += delta * (x - mean[p])
+
+            for p in range(start, stop):
+                if count[p] == 0:
+                    mean[p] = np.nan
+                    m2[p] = np.nan
+                else:
+                    m2[p] = np.sqrt(m2[p] / count[p])
+
+        return mean, m2
+
+    @njit(cache=True)
+    def summary_kernel(values):
+        """
+        Mean, population std dev, min and max of a 1D array in one pass.
+
+        NaNs are skipped; an all-NaN input gives NaN for every statistic.
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        vmin = np.inf
+        vmax = -np.inf
+
+        for i in range(values.size):
+            x = values[i]
+            if np.isnan(x):
+                continue
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+            if x < vmin:
+                vmin = x
+            if x > vmax:
+                vmax = x
+
+        if count == 0:
+            return np.nan, np.nan, np.nan, np.nan
+
+        return mean, np.sqrt(m2 / count), vmin, vmax
@@ -2,13 +2,26 @@
 
 import json
 import logging
+import math
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-import matplotlib.pyplot as plt
+import dask
 import numpy as np
 import xarray as xr
 
+# Maps are only ever written to files, so they are drawn on an explicit Agg
+# canvas rather than through pyplot; the process-wide backend (e.g. inline
+# plotting in notebooks) is left alone
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Numba kernels are optional; without Numba the numpy paths below are used
+from weather_data_tool import _kernels
+from weather_data_tool._kernels import NUMBA_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 # Try to import cartopy, but make it optional
@@ -21,84 +34,387 @@ except ImportError:
     logger.warning("Cartopy not available. Maps will use basic matplotlib plotting.")
     CARTOPY_AVAILABLE = False
 
+# Natural Earth resolution used for coastlines, borders and land on maps
+MAP_FEATURE_SCALE = "50m"
 
-def compute_ensemble_spread(
-    datasets: List[xr.Dataset],
-    variable: str,
-) -> Tuple[xr.DataArray, xr.DataArray, xr.DataArray]:
+# Try to import orjson for faster JSON export, but make it optional
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    logger.debug("orjson not available. JSON export will use the standard library.")
+    ORJSON_AVAILABLE = False
+
+
+def _welford_mean_std(arrays: Iterable[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Compute ensemble spread (standard deviation) across multiple datasets.
+    Compute mean and population std dev over a sequence of arrays in one pass.
+
+    Uses Welford's online update so each input is streamed through memory
+    once. NaNs are skipped per grid point, matching xarray's skipna default.
+    Only the accumulators are float64; inputs are read in their own dtype
+    and float32 inputs give float32 results.
 
     Args:
-        datasets: List of xarray Datasets (must be on same grid)
-        variable: Variable name to analyze
+        arrays: Iterable of equally shaped arrays (e.g. one per model)
 
     Returns:
-        Tuple of (mean, std_dev, max_spread_per_model)
+        Tuple of (mean, std_dev) arrays
+    """
+    mean = m2 = count = None
+    out_dtype = None
+
+    for a in arrays:
+        if mean is None:
+            out_dtype = np.result_type(a.dtype, np.float32)
+            mean = np.zeros(a.shape, dtype=np.float64)
+            m2 = np.zeros(a.shape, dtype=np.float64)
+            count = np.zeros(a.shape, dtype=np.int64)
+
+        missing = np.isnan(a)
+        if missing.any():
+            valid = ~missing
+            count += valid
+            delta = np.where(valid, a - mean, 0.0)
+            mean += np.divide(delta, count, out=np.zeros_like(delta), where=valid)
+            m2 += delta * np.where(valid, a - mean, 0.0)
+        else:
+            count += 1
+            delta = a - mean
+            mean += delta / count
+            m2 += delta * (a - mean)
+
+    if mean is None:
+        raise ValueError("Need at least one array to compute statistics")
+
+    # Grid points with no valid samples become NaN (0 / 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, mean, np.nan)
+        std = np.sqrt(m2 / count)
+
+    return mean.astype(out_dtype, copy=False), std.astype(out_dtype, copy=False)
+
+
+def _ensemble_members(datasets: List[xr.Dataset], variable: str) -> List[xr.DataArray]:
     """
-    logger.info(f"Computing ensemble spread for {len(datasets)} datasets")
+    Validate a list of ensemble members and extract the variable from each.
+
+    Args:
+        datasets: List of datasets on the same grid
+        variable: Variable name to extract
 
-    # Validate inputs
+    Returns:
+        List of data arrays, one per ensemble member
+    """
     if len(datasets) < 2:
         raise ValueError("Need at least 2 datasets to compute spread")
 
-    # Check that all datasets have the same grid
-    ref_shape = datasets[0].sizes
-    for i, ds in enumerate(datasets[1:], 1):
-        if ds.sizes != ref_shape:
+    # Check in one pass that the variable exists and all grids match
+    ref_shape = dict(datasets[0].sizes)
+    for i, ds in enumerate(datasets):
+        if variable not in ds.data_vars:
+            raise ValueError(f"Variable {variable} not found in dataset {i}")
+
+        shape = dict(ds.sizes)
+        if shape != ref_shape:
             raise ValueError(
-                f"Dataset {i} has different shape {ds.sizes} vs {ref_shape}"
+                f"Dataset {i} has different shape {shape} vs {ref_shape}"
             )
 
-    # Check variable exists
-    for i, ds in enumerate(datasets):
-        if variable not in ds:
-            raise ValueError(f"Variable {variable} not found in dataset {i}")
+    return [ds[variable] for ds in datasets]
+
+
+def _prestacked_ensemble(
+    ensemble: Union[xr.Dataset, xr.DataArray],
+    variable: str,
+) -> xr.DataArray:
+    """
+    Validate an ensemble already stacked along a 'model' dimension.
+
+    Args:
+        ensemble: Dataset or data array with a 'model' dimension
+        variable: Variable name to extract
+
+    Returns:
+        DataArray with dims ('model', ...)
+    """
+    if "model" not in ensemble.dims:
+        raise ValueError("Pre-stacked ensemble must have a 'model' dimension")
+
+    if isinstance(ensemble, xr.Dataset):
+        if variable not in ensemble:
+            raise ValueError(f"Variable {variable} not found in ensemble dataset")
+        stacked = ensemble[variable]
+    else:
+        stacked = ensemble
+
+    if stacked.sizes["model"] < 2:
+        raise ValueError("Need at least 2 datasets to compute spread")
+
+    return stacked.transpose("model", ...)
 
-    # Stack datasets along a new 'model' dimension
-    data_arrays = [ds[variable] for ds in datasets]
-    stacked = xr.concat(data_arrays, dim="model")
 
-    # Compute statistics
-    ensemble_mean = stacked.mean(dim="model")
-    ensemble_std = stacked.std(dim="model")
+def _stack_members(members: List[xr.DataArray], variable: str) -> xr.DataArray:
+    """
+    Stack validated ensemble members along a leading 'model' dimension.
+
+    Args:
+        members: Data arrays on the same grid
+        variable: Variable name for the stacked array
+
+    Returns:
+        DataArray with dims ('model', ...)
+    """
+    if any(member.chunks is not None for member in members):
+        # Keep Dask-backed members lazy
+        return xr.concat(
+            members,
+            dim="model",
+            coords="minimal",
+            compat="override",
+            join="override",
+        ).rename(variable)
+
+    # Stack the raw arrays into one contiguous (model, ...) block
+    template = members[0]
+    values = np.stack([member.values for member in members], axis=0)
+
+    return xr.DataArray(
+        values,
+        dims=("model",) + template.dims,
+        coords=template.coords,
+        name=variable,
+        attrs=template.attrs,
+    )
+
+
+def _ensemble_mean_std(
+    arrays: Union[Sequence[np.ndarray], np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute mean and std dev across a sequence of same-shaped member arrays.
+
+    Dispatches to the parallel Numba kernels when Numba is installed and
+    falls back to the numpy Welford pass otherwise. A contiguous stacked
+    (model, ...) array is reduced in place; a sequence of members is never
+    stacked into one array.
+
+    Args:
+        arrays: Member arrays, or a stacked (model, ...) array
+
+    Returns:
+        Tuple of (mean, std_dev) arrays with the shape of one member
+    """
+    if not NUMBA_AVAILABLE:
+        return _welford_mean_std(arrays)
+
+    grid_shape = arrays[0].shape
+
+    if (
+        isinstance(arrays, np.ndarray)
+        and arrays.flags.c_contiguous
+        and np.issubdtype(arrays.dtype, np.floating)
+    ):
+        out_dtype = np.result_type(arrays.dtype, np.float32)
+        mean, std = _kernels.welford_stacked_kernel(arrays.reshape(len(arrays), -1))
+    else:
+        dtype = np.result_type(*arrays)
+        out_dtype = np.result_type(dtype, np.float32)
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+
+        # Flattening is free for contiguous members of a common dtype
+        flat = _kernels.NumbaList()
+        for member in arrays:
+            flat.append(np.ascontiguousarray(member, dtype=dtype).ravel())
+
+        mean, std = _kernels.welford_kernel(flat)
+
+    return (
+        mean.reshape(grid_shape).astype(out_dtype, copy=False),
+        std.reshape(grid_shape).astype(out_dtype, copy=False),
+    )
+
+
+def _field_statistics(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute the NaN-aware mean, std dev, min and max of an array.
+
+    Uses a single-pass Numba kernel when Numba is installed; otherwise
+    falls back to one numpy reduction per statistic.
+
+    Args:
+        values: Array of any shape
+
+    Returns:
+        Tuple of (mean, std_dev, min, max)
+    """
+    if NUMBA_AVAILABLE:
+        if not np.issubdtype(values.dtype, np.floating):
+            values = values.astype(np.float64)
+        return _kernels.summary_kernel(np.ascontiguousarray(values).ravel())
+
+    return (
+        np.nanmean(values),
+        np.nanstd(values),
+        np.nanmin(values),
+        np.nanmax(values),
+    )
+
+
+def compute_ensemble_spread(
+    datasets: Union[List[xr.Dataset], xr.Dataset, xr.DataArray],
+    variable: str,
+    return_stacked: bool = False,
+) -> Union[
+    Tuple[xr.DataArray, xr.DataArray],
+    Tuple[xr.DataArray, xr.DataArray, xr.DataArray],
+]:
+    """
+    Compute ensemble spread (standard deviation) across multiple datasets.
+
+    Args:
+        datasets: List of xarray Datasets (must be on same grid), or a
+            dataset/data array already stacked along a 'model' dimension
+            (e.g. from load_ensemble)
+        variable: Variable name to analyze
+        return_stacked: Also return the ensemble stacked along 'model'.
+            For in-memory lists this allocates a copy of every member, so
+            it is off by default
+
+    Returns:
+        Tuple of (mean, std_dev), or (mean, std_dev, stacked ensemble) if
+        return_stacked is True
+    """
+    if isinstance(datasets, (xr.Dataset, xr.DataArray)):
+        stacked = _prestacked_ensemble(datasets, variable)
+        template = stacked.isel(model=0, drop=True)
+        lazy = stacked.chunks is not None
+    else:
+        members = _ensemble_members(datasets, variable)
+        template = members[0]
+        lazy = any(member.chunks is not None for member in members)
+        stacked = _stack_members(members, variable) if lazy or return_stacked else None
+
+    n_models = stacked.sizes["model"] if stacked is not None else len(members)
+    logger.info(f"Computing ensemble spread for {n_models} datasets")
+
+    if lazy:
+        # Dask-backed ensemble: run both reductions as one fused graph and
+        # keep the results in (distributed) memory for downstream consumers
+        ensemble_mean, ensemble_std = dask.persist(
+            stacked.mean(dim="model"),
+            stacked.std(dim="model"),
+        )
+    else:
+        # In-memory ensemble: reduce the raw member arrays directly, which
+        # avoids xarray's dispatch overhead, in a single pass over the models
+        if stacked is not None:
+            arrays = stacked.values
+        else:
+            arrays = [member.values for member in members]
+        mean_values, std_values = _ensemble_mean_std(arrays)
+        ensemble_mean = xr.DataArray(mean_values, dims=template.dims, coords=template.coords)
+        ensemble_std = xr.DataArray(std_values, dims=template.dims, coords=template.coords)
 
     logger.info(f"Ensemble spread computed: mean std = {float(ensemble_std.mean()):.3f}")
 
-    return ensemble_mean, ensemble_std, stacked
+    if return_stacked:
+        return ensemble_mean, ensemble_std, stacked
+
+    return ensemble_mean, ensemble_std
+
+
+class PairwiseDifferences(Mapping):
+    """
+    Read-only mapping of pairwise model differences, computed on access.
+
+    Keys are '<label_i>_minus_<label_j>' for i < j. Each difference field is
+    only computed (and then cached) when it is looked up, while the summary
+    statistics for every pair are computed eagerly and kept in `summary`.
+    """
+
+    def __init__(self, members: List[xr.DataArray], labels: List[str]):
+        """
+        Args:
+            members: Data arrays on the same grid, one per model
+            labels: Label for each model
+        """
+        self._members = members
+        self._pairs: Dict[str, Tuple[int, int]] = {}
+        self.summary: Dict[str, Dict[str, float]] = {}
+        self._difference = lru_cache(maxsize=None)(self._compute_difference)
+
+        if len(members) < 2:
+            return
+
+        values = np.stack([member.values for member in members], axis=0)
+        grid_axes = tuple(range(1, values.ndim))
+
+        for i in range(len(members) - 1):
+            # Subtract every later model from model i in one broadcast
+            # operation; only one (n - 1) block of fields is held at a time
+            block = values[i] - values[i + 1:]
+            mean_diffs = np.nanmean(block, axis=grid_axes)
+            max_abs_diffs = np.nanmax(np.abs(block, out=block), axis=grid_axes)
+
+            for offset, j in enumerate(range(i + 1, len(members))):
+                key = f"{labels[i]}_minus_{labels[j]}"
+                self._pairs[key] = (i, j)
+                self.summary[key] = {
+                    "mean_diff": float(mean_diffs[offset]),
+                    "max_abs_diff": float(max_abs_diffs[offset]),
+                }
+
+    def _compute_difference(self, i: int, j: int) -> xr.DataArray:
+        template = self._members[i]
+        return xr.DataArray(
+            template.values - self._members[j].values,
+            dims=template.dims,
+            coords=template.coords,
+        )
+
+    def __getitem__(self, key: str) -> xr.DataArray:
+        return self._difference(*self._pairs[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pairs)
+
+    def __len__(self) -> int:
+        return len(self._pairs)
 
 
 def compute_pairwise_differences(
     datasets: List[xr.Dataset],
     variable: str,
     labels: Optional[List[str]] = None,
-) -> Dict[str, xr.DataArray]:
+) -> PairwiseDifferences:
     """
     Compute pairwise differences between datasets.
 
+    Only the summary statistics are computed up front; each difference
+    field is computed the first time it is accessed.
+
     Args:
         datasets: List of xarray Datasets
         variable: Variable name
         labels: Optional labels for each dataset
 
     Returns:
-        Dictionary of difference arrays keyed by label pairs
+        Mapping of difference arrays keyed by label pairs, with per-pair
+        'mean_diff' and 'max_abs_diff' in its `summary` attribute
     """
     if labels is None:
         labels = [f"Model_{i}" for i in range(len(datasets))]
 
-    differences = {}
+    differences = PairwiseDifferences([ds[variable] for ds in datasets], labels)
 
-    for i in range(len(datasets)):
-        for j in range(i + 1, len(datasets)):
-            diff = datasets[i][variable] - datasets[j][variable]
-            key = f"{labels[i]}_minus_{labels[j]}"
-            differences[key] = diff
-
-            logger.info(
-                f"{key}: mean diff = {float(diff.mean()):.3f}, "
-                f"max abs diff = {float(np.abs(diff).max()):.3f}"
-            )
+    for key, stats in differences.summary.items():
+        logger.info(
+            f"{key}: mean diff = {stats['mean_diff']:.3f}, "
+            f"max abs diff = {stats['max_abs_diff']:.3f}"
+        )
 
     return differences
 
@@ -117,36 +433,131 @@ def find_top_spread_locations(
     Returns:
         List of dictionaries with location info
     """
-    # Flatten and find top values
-    flat_spread = spread.values.flatten()
-    flat_indices = np.argsort(flat_spread)[-top_n:][::-1]
+    # Flatten (a view when contiguous) and select the top values in O(n),
+    # sorting only the selected entries
+    flat_spread = spread.values.ravel()
+    top_n = min(top_n, flat_spread.size)
+    if top_n <= 0:
+        return []
+
+    candidates = np.argpartition(flat_spread, -top_n)[-top_n:]
+    flat_indices = candidates[np.argsort(flat_spread[candidates])[::-1]]
+
+    # Look up all coordinates at once on the raw arrays; the last two dims
+    # are lat, lon
+    idx = np.unravel_index(flat_indices, spread.shape)
+    lats = spread["lat"].values[idx[-2]]
+    lons = spread["lon"].values[idx[-1]]
+    values = flat_spread[flat_indices]
+
+    locations = [
+        {"lat": float(lat), "lon": float(lon), "spread": float(value)}
+        for lat, lon, value in zip(lats, lons, values)
+    ]
 
-    # Convert to 2D indices
-    shape = spread.shape
-    locations = []
+    return locations
 
-    for flat_idx in flat_indices:
-        idx_2d = np.unravel_index(flat_idx, shape)
 
-        # Get coordinates
-        lat_idx, lon_idx = idx_2d[-2], idx_2d[-1]  # Last two dims are lat, lon
+@lru_cache(maxsize=None)
+def _get_map_features(scale: str) -> Tuple:
+    """
+    Get Natural Earth map features at a fixed scale, built once per scale.
 
-        lat = float(spread.lat[lat_idx])
-        lon = float(spread.lon[lon_idx])
-        value = float(flat_spread[flat_idx])
+    Reusing the same feature objects lets Cartopy reuse the shapefile
+    geometries it has already loaded across map renders.
 
-        locations.append({
-            "lat": lat,
-            "lon": lon,
-            "spread": value,
-        })
+    Args:
+        scale: Natural Earth scale ('10m', '50m' or '110m')
 
-    return locations
+    Returns:
+        Tuple of (coastline, borders, land) features
+    """
+    return (
+        cfeature.COASTLINE.with_scale(scale),
+        cfeature.BORDERS.with_scale(scale),
+        cfeature.LAND.with_scale(scale),
+    )
+
+
+def _regular_grid_extent(
+    spread: xr.DataArray,
+) -> Optional[Tuple[List[float], str]]:
+    """
+    Get the image extent and origin of a field on a uniform lat/lon grid.
+
+    Args:
+        spread: Data array with 'lat' and 'lon' dimensions
+
+    Returns:
+        Tuple of (extent, origin) for imshow, or None if the grid is not
+        uniformly spaced (or not laid out as lat x lon)
+    """
+    if spread.dims != ("lat", "lon") or spread.sizes["lat"] < 2 or spread.sizes["lon"] < 2:
+        return None
+
+    lats = spread["lat"].values
+    lons = spread["lon"].values
+    dlat = np.diff(lats)
+    dlon = np.diff(lons)
+
+    if not (np.allclose(dlat, dlat[0]) and np.allclose(dlon, dlon[0]) and dlon[0] > 0):
+        return None
+
+    # Extent covers cell edges so pixels are centred on grid points
+    half_lat = abs(dlat[0]) / 2
+    half_lon = dlon[0] / 2
+    extent = [
+        float(lons[0] - half_lon),
+        float(lons[-1] + half_lon),
+        float(lats.min() - half_lat),
+        float(lats.max() + half_lat),
+    ]
+    origin = "lower" if dlat[0] > 0 else "upper"
+
+    return extent, origin
+
+
+def _plot_field(ax, spread: xr.DataArray, **kwargs):
+    """
+    Draw a lat/lon field, using imshow on uniform grids and pcolormesh otherwise.
+
+    Args:
+        ax: Matplotlib (or Cartopy) axes
+        spread: Data array to plot
+        **kwargs: Extra keyword arguments for the plotting call
+
+    Returns:
+        The plotted artist (for the colorbar)
+    """
+    regular = _regular_grid_extent(spread)
+
+    if regular is not None:
+        # A raster blit is much cheaper than building one polygon per cell
+        extent, origin = regular
+        return ax.imshow(
+            spread.values,
+            extent=extent,
+            origin=origin,
+            cmap="YlOrRd",
+            interpolation="nearest",
+            rasterized=True,
+            **kwargs,
+        )
+
+    return ax.pcolormesh(
+        spread.lon,
+        spread.lat,
+        spread,
+        cmap="YlOrRd",
+        shading="auto",
+        rasterized=True,
+        **kwargs,
+    )
 
 
 def create_spread_map(
     spread: xr.DataArray,
-    output_path: Path,
+    output_path: Union[Path, BinaryIO],
     title: Optional[str] = None,
     variable_name: Optional[str] = None,
     units: Optional[str] = None,
@@ -156,13 +567,15 @@ def create_spread_map(
 
     Args:
         spread: Spread data array (lat x lon)
-        output_path: Output file path for PNG
+        output_path: Output file path for PNG, or a binary file-like object
+            the PNG is written to (e.g. io.BytesIO)
         title: Plot title
         variable_name: Variable name for labeling
         units: Variable units for labeling
     """
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not hasattr(output_path, "write"):
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Creating spread map: {output_path}")
 
@@ -177,23 +590,17 @@ def create_spread_map(
 
     # Create figure
     if CARTOPY_AVAILABLE:
-        fig = plt.figure(figsize=(12, 8))
-        ax = plt.axes(projection=ccrs.PlateCarree())
+        fig = Figure(figsize=(12, 8))
+        ax = fig.add_subplot(projection=ccrs.PlateCarree())
 
         # Add features
-        ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
-        ax.add_feature(cfeature.BORDERS, linewidth=0.3, linestyle=":")
-        ax.add_feature(cfeature.LAND, facecolor="lightgray", alpha=0.3)
+        coastline, borders, land = _get_map_features(MAP_FEATURE_SCALE)
+        ax.add_feature(coastline, linewidth=0.5)
+        ax.add_feature(borders, linewidth=0.3, linestyle=":")
+        ax.add_feature(land, facecolor="lightgray", alpha=0.3)
 
         # Plot data
-        im = ax.pcolormesh(
-            spread.lon,
-            spread.lat,
-            spread,
-            transform=ccrs.PlateCarree(),
-            cmap="YlOrRd",
-            shading="auto",
-        )
+        im = _plot_field(ax, spread, transform=ccrs.PlateCarree())
 
         # Add gridlines
         gl = ax.gridlines(draw_labels=True, linewidth=0.5, alpha=0.5, linestyle="--")
@@ -202,15 +609,10 @@ def create_spread_map(
 
     else:
         # Fallback: simple matplotlib plot
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        ax = fig.add_subplot()
 
-        im = ax.pcolormesh(
-            spread.lon,
-            spread.lat,
-            spread,
-            cmap="YlOrRd",
-            shading="auto",
-        )
+        im = _plot_field(ax, spread)
 
         ax.set_xlabel("Longitude (°E)")
         ax.set_ylabel("Latitude (°N)")
@@ -218,22 +620,22 @@ def create_spread_map(
         ax.set_aspect("equal")
 
     # Add colorbar
-    cbar = plt.colorbar(im, ax=ax, orientation="vertical", pad=0.05, shrink=0.8)
+    cbar = fig.colorbar(im, ax=ax, orientation="vertical", pad=0.05, shrink=0.8)
     cbar.set_label(cbar_label, fontsize=11)
 
     # Title
-    plt.title(title, fontsize=14, fontweight="bold", pad=20)
+    ax.set_title(title, fontsize=14, fontweight="bold", pad=20)
 
-    # Save
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    # Save with fixed margins; tight bounding boxes cost an extra render pass
+    fig.subplots_adjust(left=0.07, right=0.97, bottom=0.07, top=0.9)
+    FigureCanvasAgg(fig)
+    fig.savefig(output_path, dpi=150, format="png")
 
     logger.info(f"Map saved to {output_path}")
 
 
 def analyze_datasets(
-    datasets: List[xr.Dataset],
+    datasets: Union[List[xr.Dataset], xr.Dataset],
     variable: str,
     labels: Optional[List[str]] = None,
     output_map: Optional[Path] = None,
@@ -242,7 +644,8 @@ def analyze_datasets(
     Perform comprehensive analysis of multiple datasets.
 
     Args:
-        datasets: List of datasets on the same grid
+        datasets: List of datasets on the same grid, or one dataset stacked
+            along a 'model' dimension
         variable: Variable to analyze
         labels: Labels for each dataset
         output_map: Optional path to save spread map
@@ -250,42 +653,84 @@ def analyze_datasets(
     Returns:
         Dictionary with analysis results
     """
-    logger.info(f"Analyzing {len(datasets)} datasets for variable: {variable}")
+    # Compute ensemble statistics; only a pre-stacked ensemble is kept
+    # stacked, since indexing its models is free
+    if isinstance(datasets, (xr.Dataset, xr.DataArray)):
+        ensemble_mean, ensemble_std, stacked = compute_ensemble_spread(
+            datasets, variable, return_stacked=True
+        )
+        members = [stacked.isel(model=i) for i in range(stacked.sizes["model"])]
+    else:
+        ensemble_mean, ensemble_std = compute_ensemble_spread(
+            datasets, variable, return_stacked=False
+        )
+        members = [ds[variable] for ds in datasets]
 
-    if labels is None:
-        labels = [f"Model_{i}" for i in range(len(datasets))]
+    n_models = len(members)
+
+    logger.info(f"Analyzing {n_models} datasets for variable: {variable}")
 
-    # Compute ensemble statistics
-    ensemble_mean, ensemble_std, stacked = compute_ensemble_spread(datasets, variable)
+    if labels is None:
+        labels = [f"Model_{i}" for i in range(n_models)]
 
     # Find top spread locations
     top_locations = find_top_spread_locations(ensemble_std, top_n=3)
 
+    # Per-model and spread statistics, reduced member by member so the
+    # ensemble is never copied into one block
+    lazy = ensemble_std.chunks is not None or any(
+        member.chunks is not None for member in members
+    )
+    if not lazy:
+        # One pass per model for all four statistics
+        model_means, model_stds, model_mins, model_maxs = zip(
+            *(_field_statistics(member.values) for member in members)
+        )
+        spread_values = ensemble_std.values
+        mean_spread = np.nanmean(spread_values)
+        max_spread = np.nanmax(spread_values)
+        min_spread = np.nanmin(spread_values)
+    else:
+        # Evaluate everything together so Dask executes one graph instead
+        # of one per scalar
+        (
+            model_means,
+            model_stds,
+            model_mins,
+            model_maxs,
+            (mean_spread, max_spread, min_spread),
+        ) = dask.compute(
+            [member.mean() for member in members],
+            [member.std() for member in members],
+            [member.min() for member in members],
+            [member.max() for member in members],
+            (ensemble_std.mean(), ensemble_std.max(), ensemble_std.min()),
+        )
+
     # Compute basic statistics for each dataset
     model_stats = []
-    for i, (ds, label) in enumerate(zip(datasets, labels)):
-        var_data = ds[variable]
+    for i, label in enumerate(labels):
         stats = {
             "label": label,
-            "mean": float(var_data.mean()),
-            "std": float(var_data.std()),
-            "min": float(var_data.min()),
-            "max": float(var_data.max()),
+            "mean": float(model_means[i]),
+            "std": float(model_stds[i]),
+            "min": float(model_mins[i]),
+            "max": float(model_maxs[i]),
         }
         model_stats.append(stats)
 
     # Overall spread statistics
     spread_stats = {
-        "mean_spread": float(ensemble_std.mean()),
-        "max_spread": float(ensemble_std.max()),
-        "min_spread": float(ensemble_std.min()),
+        "mean_spread": float(mean_spread),
+        "max_spread": float(max_spread),
+        "min_spread": float(min_spread),
     }
 
     # Create visualization if requested
     if output_map:
-        # Get units from first dataset
-        units = datasets[0][variable].attrs.get("units", "unknown")
-        var_long_name = datasets[0][variable].attrs.get("long_name", variable)
+        # Get units from the first dataset
+        units = members[0].attrs.get("units", "unknown")
+        var_long_name = members[0].attrs.get("long_name", variable)
 
         create_spread_map(
             ensemble_std,
@@ -298,7 +743,7 @@ def analyze_datasets(
     # Compile results
     results = {
         "variable": variable,
-        "n_models": len(datasets),
+        "n_models": n_models,
         "spread_statistics": spread_stats,
         "top_spread_locations": top_locations,
         "model_statistics": model_stats,
@@ -346,6 +791,49 @@ def print_analysis_summary(results: Dict) -> None:
     print("\n" + "=" * 70 + "\n")
 
 
+def _json_compatible(obj):
+    """
+    Convert results for the standard library JSON encoder, as orjson would.
+
+    Numpy values become Python ones and NaN/Inf become None (JSON null).
+
+    Args:
+        obj: Results value, possibly nested
+
+    Returns:
+        JSON-serializable equivalent
+    """
+    if isinstance(obj, Mapping):
+        return {key: _json_compatible(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_compatible(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _json_compatible(obj.tolist())
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+def dumps_analysis_json(results: Dict) -> bytes:
+    """
+    Serialize analysis results to indented JSON in memory.
+
+    Non-finite statistics are written as null with either backend.
+
+    Args:
+        results: Results dictionary
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    return json.dumps(_json_compatible(results), indent=2, allow_nan=False).encode("utf-8")
+
+
 def export_analysis_json(results: Dict, output_path: Path) -> None:
     """
     Export analysis results to JSON.
@@ -357,7 +845,6 @@ def export_analysis_json(results: Dict, output_path: Path) -> None:
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
+    output_path.write_bytes(dumps_analysis_json(results))
 
     logger.info(f"Analysis results exported to {output_path}")
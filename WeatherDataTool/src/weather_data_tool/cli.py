@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import List, Optional
 
 import click
+import dask
 
 from weather_data_tool.analyze import (
     analyze_datasets,
@@ -14,7 +15,13 @@ from weather_data_tool.analyze import (
     print_analysis_summary,
 )
 from weather_data_tool.download import get_provider
-from weather_data_tool.io import load_dataset, save_dataset, spatial_subset
+from weather_data_tool.io import (
+    NETCDF_CODECS,
+    load_dataset,
+    load_ensemble,
+    save_dataset,
+    spatial_subset,
+)
 from weather_data_tool.regrid import (
     create_reference_grid,
     get_grid_from_config,
@@ -24,6 +31,49 @@ from weather_data_tool.utils import load_config, parse_datetime, setup_logging,
 
 logger = logging.getLogger(__name__)
 
+# Dask chunking for analysis inputs: small enough that global high-resolution
+# grids stacked over many models never need to fit in memory at once
+ANALYSIS_CHUNKS = {"time": 1, "lat": 360, "lon": 360}
+
+
+def _variable_output_path(path: Path, variable: str) -> Path:
+    """
+    Derive a per-variable output path, e.g. 'spread.png' -> 'spread_t2m.png'.
+
+    Args:
+        path: Output path given on the command line
+        variable: Variable name
+
+    Returns:
+        Path with the variable name appended to the file stem
+    """
+    return path.with_name(f"{path.stem}_{variable}{path.suffix}")
+
+
+def _analyze_variable(
+    file_list: List[str],
+    variable: str,
+    labels: Optional[List[str]],
+    output_map: Path,
+) -> dict:
+    """
+    Open the ensemble and analyze a single variable.
+
+    Used as one task per variable; each task opens the files itself so only
+    file paths (not data) are sent to worker processes.
+
+    Args:
+        file_list: Input files, one per model
+        variable: Variable to analyze
+        labels: Labels for each file
+        output_map: Path for the spread map
+
+    Returns:
+        Analysis results dictionary
+    """
+    ensemble = load_ensemble(file_list, chunks=ANALYSIS_CHUNKS)
+    return analyze_datasets(ensemble, variable, labels=labels, output_map=output_map)
+
 
 @click.group()
 @click.option(
@@ -84,6 +134,11 @@ def cli(ctx, log_level: str):
     type=click.Path(),
     help="Output file path. If not provided, uses automatic naming in data/raw/",
 )
+@click.option(
+    "--codec",
+    type=click.Choice(NETCDF_CODECS),
+    help="NetCDF compression codec. If not provided, uses the config default.",
+)
 @click.pass_context
 def download(
     ctx,
@@ -94,9 +149,11 @@ def download(
     region: Optional[str],
     bounds: Optional[str],
     output: Optional[str],
+    codec: Optional[str],
 ):
     """Download weather data from a provider."""
     config = ctx.obj["config"]
+    codec = codec or config["defaults"].get("codec", "zlib")
 
     try:
         # Parse run time if provided
@@ -143,8 +200,11 @@ def download(
             filename = f"{provider}_{variable}_f{forecast_hour:03d}.nc"
             output_path = output_dir / filename
 
-        # Save dataset
-        save_dataset(ds, output_path)
+        # Save dataset; the (subset) field is fetched here, with parallel
+        # chunk reads for providers that set a read concurrency
+        num_workers = getattr(data_provider, "zarr_concurrency", None)
+        with dask.config.set(scheduler="threads", num_workers=num_workers):
+            save_dataset(ds, output_path, codec=codec)
 
         click.echo(f"✓ Successfully downloaded data to: {output_path}")
 
@@ -183,6 +243,11 @@ def download(
     required=True,
     help="Output NetCDF file path",
 )
+@click.option(
+    "--codec",
+    type=click.Choice(NETCDF_CODECS),
+    help="NetCDF compression codec. If not provided, uses the config default.",
+)
 @click.pass_context
 def regrid(
     ctx,
@@ -191,9 +256,11 @@ def regrid(
     region: Optional[str],
     method: str,
     output: str,
+    codec: Optional[str],
 ):
     """Regrid a dataset to a target grid."""
     config = ctx.obj["config"]
+    codec = codec or config["defaults"].get("codec", "zlib")
 
     try:
         # Load source dataset
@@ -218,7 +285,7 @@ def regrid(
 
         # Save output
         output_path = Path(output)
-        save_dataset(ds_regridded, output_path)
+        save_dataset(ds_regridded, output_path, codec=codec)
 
         click.echo(f"✓ Successfully regridded data to: {output_path}")
 
@@ -231,9 +298,13 @@ def regrid(
 @cli.command()
 @click.option(
     "--var",
-    "variable",
+    "variables",
     required=True,
-    help="Variable name to analyze (must be present in all files)",
+    multiple=True,
+    help=(
+        "Variable name to analyze (must be present in all files). Repeat --var "
+        "to analyze several variables in parallel."
+    ),
 )
 @click.option(
     "--files",
@@ -251,18 +322,18 @@ def regrid(
     "--output",
     type=click.Path(),
     required=True,
-    help="Output PNG file for spread map",
+    help="Output PNG file for spread map (suffixed with the variable name if several --var)",
 )
 @click.option(
     "--json",
     "json_output",
     type=click.Path(),
-    help="Optional JSON file for analysis results",
+    help="Optional JSON file for analysis results (suffixed like --output)",
 )
 @click.pass_context
 def analyze(
     ctx,
-    variable: str,
+    variables: tuple,
     files: tuple,
     labels: Optional[tuple],
     output: str,
@@ -281,30 +352,43 @@ def analyze(
         file_list = list(files)
         label_list = list(labels) if labels else None
 
-        # Load datasets
+        # Per-variable output paths
+        if len(variables) == 1:
+            map_paths = [Path(output)]
+            json_paths = [Path(json_output)] if json_output else [None]
+        else:
+            map_paths = [_variable_output_path(Path(output), v) for v in variables]
+            json_paths = [
+                _variable_output_path(Path(json_output), v) if json_output else None
+                for v in variables
+            ]
+
+        # Each task opens all files as one lazily stacked ensemble; Dask opens
+        # them in parallel and the reductions run as a single fused graph
         logger.info(f"Loading {len(file_list)} datasets")
-        datasets = []
-        for file_path in file_list:
-            ds = load_dataset(Path(file_path))
-            datasets.append(ds)
-
-        # Perform analysis
-        results = analyze_datasets(
-            datasets,
-            variable,
-            labels=label_list,
-            output_map=Path(output),
-        )
-
-        # Print summary
-        print_analysis_summary(results)
-
-        # Export JSON if requested
-        if json_output:
-            export_analysis_json(results, Path(json_output))
-            click.echo(f"✓ Analysis results saved to: {json_output}")
-
-        click.echo(f"✓ Spread map saved to: {output}")
+        if len(variables) == 1:
+            all_results = [
+                _analyze_variable(file_list, variables[0], label_list, map_paths[0])
+            ]
+        else:
+            # Fan out one process per variable
+            logger.info(f"Analyzing {len(variables)} variables in parallel")
+            tasks = [
+                dask.delayed(_analyze_variable)(file_list, v, label_list, map_path)
+                for v, map_path in zip(variables, map_paths)
+            ]
+            all_results = dask.compute(*tasks, scheduler="processes")
+
+        for results, map_path, json_path in zip(all_results, map_paths, json_paths):
+            # Print summary
+            print_analysis_summary(results)
+
+            # Export JSON if requested
+            if json_path:
+                export_analysis_json(results, json_path)
+                click.echo(f"✓ Analysis results saved to: {json_path}")
+
+            click.echo(f"✓ Spread map saved to: {map_path}")
 
     except Exception as e:
         logger.error(f"Analysis failed: {e}", exc_info=True)
@@ -2,17 +2,113 @@
 
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Sequence, Union
 
+import dask.array as dsa
 import fsspec
+import requests
 import xarray as xr
+import zarr
+from requests.adapters import HTTPAdapter
 
 from weather_data_tool.utils import format_run_time, get_cycle_hour
 
 logger = logging.getLogger(__name__)
 
+# Try to import pydap for pooled-HTTP OPeNDAP access, but make it optional
+try:
+    import pydap.client  # noqa: F401
+
+    PYDAP_AVAILABLE = True
+except ImportError:
+    logger.debug("pydap not available. OPeNDAP will use the netcdf4 engine.")
+    PYDAP_AVAILABLE = False
+
+# Connections kept open per host for OPeNDAP requests
+HTTP_POOL_SIZE = 16
+
+# Opened OPeNDAP datasets kept around (one per model run and engine)
+OPENDAP_CACHE_SIZE = 8
+
+# Dask chunking for OPeNDAP datasets, so each forecast step is its own request
+OPENDAP_CHUNKS = {"time": 1}
+
+# Encoding entries xarray moves out of attrs when it CF-decodes a variable
+CF_DECODING_KEYS = ("_FillValue", "missing_value", "scale_factor", "add_offset", "_Unsigned")
+
+
+@lru_cache(maxsize=None)
+def _get_http_session() -> requests.Session:
+    """
+    Get a shared HTTP session with a connection pool, created once.
+
+    Returns:
+        requests Session that reuses keep-alive connections
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=32)
+def _open_zarr_store(url: str) -> xr.Dataset:
+    """
+    Open a remote Zarr store lazily, memoized so its metadata is read once.
+
+    Args:
+        url: Store URL (e.g. 's3://...')
+
+    Returns:
+        Lazily loaded dataset; callers must not modify it in place
+    """
+    # fsspec's async S3 filesystem fetches chunk batches concurrently
+    return xr.open_zarr(
+        url,
+        storage_options={"anon": True},
+        consolidated=True,
+        chunks={},
+    )
+
+
+@lru_cache(maxsize=32)
+def _open_zarr_group(url: str) -> zarr.Group:
+    """
+    Open a remote Zarr group from its consolidated metadata, memoized.
+
+    Args:
+        url: Store URL (e.g. 's3://...')
+
+    Returns:
+        Read-only Zarr group whose arrays are read directly, without xarray
+    """
+    return zarr.open_consolidated(fsspec.get_mapper(url, anon=True), mode="r")
+
+
+@lru_cache(maxsize=OPENDAP_CACHE_SIZE)
+def _open_opendap(url: str, engine: str) -> xr.Dataset:
+    """
+    Open an OPeNDAP URL lazily, memoized so its DDS/DAS are fetched once.
+
+    Args:
+        url: OPeNDAP dataset URL
+        engine: 'netcdf4' or 'pydap'
+
+    Returns:
+        Lazily loaded dataset; callers must not modify it in place
+    """
+    if engine == "pydap":
+        # Metadata and data requests share one keep-alive connection pool
+        store = xr.backends.PydapDataStore.open(url, session=_get_http_session())
+        return xr.open_dataset(store, chunks=OPENDAP_CHUNKS)
+
+    return xr.open_dataset(url, engine="netcdf4", chunks=OPENDAP_CHUNKS)
+
 
 class Provider(Protocol):
     """Protocol defining the interface for data providers."""
@@ -38,6 +134,25 @@ class Provider(Protocol):
         """
         ...
 
+    def open_forecast_series(
+        self,
+        variable: str,
+        forecast_hours: Sequence[int],
+        run_time: Optional[datetime] = None,
+    ) -> xr.Dataset:
+        """
+        Open several forecast hours of a variable stacked along 'time'.
+
+        Args:
+            variable: Variable name (e.g., 't2m', 'u10')
+            forecast_hours: Forecast hours
+            run_time: Model run time (if None, uses most recent)
+
+        Returns:
+            xarray Dataset with a 'time' dimension
+        """
+        ...
+
 
 class BaseProvider(ABC):
     """Base class for data providers."""
@@ -57,6 +172,9 @@ class BaseProvider(ABC):
         self.cycles = config.get("cycles", ["00", "06", "12", "18"])
         self.enabled = config.get("enabled", True)
 
+        # Cycle hours, latest first, parsed once for get_latest_run_time
+        self._cycle_hours_desc = tuple(sorted({int(c) for c in self.cycles}, reverse=True))
+
         logger.info(f"Initialized provider: {self.name}")
 
     def get_variable_name(self, standard_name: str) -> str:
@@ -100,25 +218,55 @@ class BaseProvider(ABC):
         Returns:
             datetime of latest run
         """
-        now = datetime.utcnow()
-
-        # Find most recent cycle
-        current_hour = now.hour
-        cycle_hours = [int(c) for c in self.cycles]
+        # Naive UTC, matching the run times used everywhere else
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
 
         # Find the most recent cycle that has likely completed
-        for cycle_hour in sorted(cycle_hours, reverse=True):
+        current_hour = now.hour
+        for cycle_hour in self._cycle_hours_desc:
             if current_hour >= cycle_hour + 3:  # Allow 3 hours for data availability
-                run_time = now.replace(hour=cycle_hour, minute=0, second=0, microsecond=0)
-                return run_time
+                return now.replace(hour=cycle_hour, minute=0, second=0, microsecond=0)
 
         # If no cycle today, use last cycle from yesterday
         yesterday = now - timedelta(days=1)
-        latest_cycle = max(cycle_hours)
+        latest_cycle = self._cycle_hours_desc[0]
         run_time = yesterday.replace(hour=latest_cycle, minute=0, second=0, microsecond=0)
 
         return run_time
 
+    def _time_index(self, forecast_hour: int, n_times: int) -> int:
+        """
+        Get the index along 'time' of a forecast hour.
+
+        Args:
+            forecast_hour: Forecast hour
+            n_times: Length of the 'time' dimension
+
+        Returns:
+            Time index
+        """
+        return forecast_hour
+
+    def _select_times(
+        self,
+        forecast_hours: Union[int, List[int]],
+        n_times: int,
+    ) -> Union[int, List[int]]:
+        """
+        Map one forecast hour or a list of them to 'time' indices.
+
+        Args:
+            forecast_hours: Forecast hour, or list of forecast hours
+            n_times: Length of the 'time' dimension
+
+        Returns:
+            Time index (scalar selection) or list of indices
+        """
+        if isinstance(forecast_hours, int):
+            return self._time_index(forecast_hours, n_times)
+
+        return [self._time_index(forecast_hour, n_times) for forecast_hour in forecast_hours]
+
     @abstractmethod
     def open_dataset(
         self,
@@ -129,10 +277,72 @@ class BaseProvider(ABC):
         """Open remote dataset."""
         pass
 
+    def open_forecast_series(
+        self,
+        variable: str,
+        forecast_hours: Sequence[int],
+        run_time: Optional[datetime] = None,
+    ) -> xr.Dataset:
+        """
+        Open several forecast hours of a variable stacked along 'time'.
+
+        Hours are opened concurrently so per-request latency overlaps.
+        Providers that serve every hour of a run from one dataset override
+        this to select all hours in a single request.
+
+        Args:
+            variable: Standard variable name (e.g., 't2m')
+            forecast_hours: Forecast hours
+            run_time: Model run time (if None, uses most recent)
+
+        Returns:
+            xarray Dataset with a 'time' dimension
+        """
+        # Resolve the run once so every hour comes from the same cycle
+        if run_time is None:
+            run_time = self.get_latest_run_time()
+
+        with ThreadPoolExecutor(max_workers=max(len(forecast_hours), 1)) as executor:
+            datasets = list(
+                executor.map(
+                    lambda forecast_hour: self.open_dataset(variable, forecast_hour, run_time),
+                    forecast_hours,
+                )
+            )
+
+        return xr.concat(datasets, dim="time")
+
 
 class GFSOpenDAPProvider(BaseProvider):
     """NOAA GFS data via NOMADS OPeNDAP."""
 
+    def __init__(self, config: Dict):
+        """
+        Initialize provider with configuration.
+
+        Args:
+            config: Provider configuration dictionary
+        """
+        super().__init__(config)
+        # 'netcdf4' (default) or 'pydap' for pooled HTTP connections
+        self.engine = config.get("engine", "netcdf4")
+
+    def _open_remote(self, url: str) -> xr.Dataset:
+        """
+        Open an OPeNDAP URL lazily with the configured engine.
+
+        Args:
+            url: OPeNDAP dataset URL
+
+        Returns:
+            Lazily loaded dataset
+        """
+        if self.engine == "pydap" and not PYDAP_AVAILABLE:
+            raise RuntimeError("The pydap engine requires pydap (pip install pydap)")
+
+        # Shallow copy so callers never modify the cached dataset
+        return _open_opendap(url, self.engine).copy(deep=False)
+
     def open_dataset(
         self,
         variable: str,
@@ -147,6 +357,57 @@ class GFSOpenDAPProvider(BaseProvider):
             forecast_hour: Forecast hour
             run_time: Model run time (if None, uses most recent)
 
+        Returns:
+            xarray Dataset with requested variable
+        """
+        return self._open_hours(variable, forecast_hour, run_time)
+
+    def open_forecast_series(
+        self,
+        variable: str,
+        forecast_hours: Sequence[int],
+        run_time: Optional[datetime] = None,
+    ) -> xr.Dataset:
+        """
+        Open several GFS forecast hours of a variable in a single request.
+
+        Args:
+            variable: Standard variable name (e.g., 't2m')
+            forecast_hours: Forecast hours
+            run_time: Model run time (if None, uses most recent)
+
+        Returns:
+            xarray Dataset with requested variable and a 'time' dimension
+        """
+        return self._open_hours(variable, list(forecast_hours), run_time)
+
+    def _time_index(self, forecast_hour: int, n_times: int) -> int:
+        """
+        Get the index along 'time' of a forecast hour.
+
+        Args:
+            forecast_hour: Forecast hour
+            n_times: Length of the 'time' dimension
+
+        Returns:
+            Time index
+        """
+        return forecast_hour // 6  # GFS has 6-hourly output initially
+
+    def _open_hours(
+        self,
+        variable: str,
+        forecast_hours: Union[int, List[int]],
+        run_time: Optional[datetime],
+    ) -> xr.Dataset:
+        """
+        Open one forecast hour (int) or a series of them (list) from one run.
+
+        Args:
+            variable: Standard variable name (e.g., 't2m')
+            forecast_hours: Forecast hour, or list of forecast hours
+            run_time: Model run time (if None, uses most recent)
+
         Returns:
             xarray Dataset with requested variable
         """
@@ -156,7 +417,9 @@ class GFSOpenDAPProvider(BaseProvider):
         if run_time is None:
             run_time = self.get_latest_run_time()
 
-        self.validate_forecast_hour(forecast_hour)
+        hours = [forecast_hours] if isinstance(forecast_hours, int) else forecast_hours
+        for forecast_hour in hours:
+            self.validate_forecast_hour(forecast_hour)
         provider_var = self.get_variable_name(variable)
 
         # Build OPeNDAP URL
@@ -167,17 +430,13 @@ class GFSOpenDAPProvider(BaseProvider):
         url = self.base_url.format(date=date_str, cycle=cycle)
 
         logger.info(f"Opening GFS data from {url}")
-        logger.info(f"Variable: {provider_var}, Forecast hour: {forecast_hour}")
+        logger.info(f"Variable: {provider_var}, Forecast hour(s): {forecast_hours}")
 
         try:
             # Open with xarray
-            ds = xr.open_dataset(url, engine="netcdf4")
-
-            # Select forecast hour
-            if "time" in ds.dims:
-                ds = ds.isel(time=forecast_hour // 6)  # GFS has 6-hourly output initially
+            ds = self._open_remote(url)
 
-            # Select variable
+            # Select variable first so the time selection touches only its arrays
             if provider_var in ds:
                 ds = ds[[provider_var]]
             else:
@@ -186,6 +445,10 @@ class GFSOpenDAPProvider(BaseProvider):
                     f"Variable {provider_var} not found. Available: {available}"
                 )
 
+            # Select forecast hour
+            if "time" in ds.dims:
+                ds = ds.isel(time=self._select_times(forecast_hours, ds.sizes["time"]))
+
             # Rename to standard name
             ds = ds.rename({provider_var: variable})
 
@@ -203,6 +466,17 @@ class GFSOpenDAPProvider(BaseProvider):
 class HRRRZarrProvider(BaseProvider):
     """HRRR data via cloud-optimized Zarr (Herbie)."""
 
+    def __init__(self, config: Dict):
+        """
+        Initialize provider with configuration.
+
+        Args:
+            config: Provider configuration dictionary
+        """
+        super().__init__(config)
+        # Number of threads used to fetch chunks when the field is computed
+        self.zarr_concurrency = config.get("zarr_concurrency", 16)
+
     def open_dataset(
         self,
         variable: str,
@@ -220,13 +494,93 @@ class HRRRZarrProvider(BaseProvider):
         Returns:
             xarray Dataset with requested variable
         """
+        return self._open_hours(variable, forecast_hour, run_time)
+
+    def open_forecast_series(
+        self,
+        variable: str,
+        forecast_hours: Sequence[int],
+        run_time: Optional[datetime] = None,
+    ) -> xr.Dataset:
+        """
+        Open several HRRR forecast hours of a variable in a single request.
+
+        Args:
+            variable: Standard variable name (e.g., 't2m')
+            forecast_hours: Forecast hours
+            run_time: Model run time (if None, uses most recent)
+
+        Returns:
+            xarray Dataset with requested variable and a 'time' dimension
+        """
+        return self._open_hours(variable, list(forecast_hours), run_time)
+
+    def _time_index(self, forecast_hour: int, n_times: int) -> int:
+        """
+        Get the index along 'time' of a forecast hour.
+
+        Args:
+            forecast_hour: Forecast hour
+            n_times: Length of the 'time' dimension
+
+        Returns:
+            Time index
+        """
+        return min(forecast_hour, n_times - 1)
+
+    def open_dataset_dask(
+        self,
+        variable: str,
+        forecast_hour: int,
+        run_time: Optional[datetime] = None,
+    ) -> xr.Dataset:
+        """
+        Open HRRR dataset lazily as a Dask array over the Zarr array itself.
+
+        Unlike open_dataset, each Dask task reads a chunk straight from the
+        Zarr array rather than through xarray's backend, so downstream
+        operations fuse with the reads.
+
+        Args:
+            variable: Standard variable name (e.g., 't2m')
+            forecast_hour: Forecast hour (0-18)
+            run_time: Model run time (if None, uses most recent)
+
+        Returns:
+            xarray Dataset with requested variable backed by Dask
+        """
+        return self._open_hours(variable, forecast_hour, run_time, from_zarr=True)
+
+    def _open_hours(
+        self,
+        variable: str,
+        forecast_hours: Union[int, List[int]],
+        run_time: Optional[datetime],
+        from_zarr: bool = False,
+    ) -> xr.Dataset:
+        """
+        Open one forecast hour (int) or a series of them (list) from one run.
+
+        Args:
+            variable: Standard variable name (e.g., 't2m')
+            forecast_hours: Forecast hour, or list of forecast hours
+            run_time: Model run time (if None, uses most recent)
+            from_zarr: Back the variable with a Dask array over the Zarr
+                array itself instead of xarray's backend wrapper
+
+        Returns:
+            Lazily loaded xarray Dataset with requested variable; nothing is
+            fetched until its values are computed
+        """
         if not self.enabled:
             raise RuntimeError(f"Provider {self.name} is not enabled")
 
         if run_time is None:
             run_time = self.get_latest_run_time()
 
-        self.validate_forecast_hour(forecast_hour)
+        hours = [forecast_hours] if isinstance(forecast_hours, int) else forecast_hours
+        for forecast_hour in hours:
+            self.validate_forecast_hour(forecast_hour)
         provider_var = self.get_variable_name(variable)
 
         # Build Zarr store URL
@@ -236,18 +590,14 @@ class HRRRZarrProvider(BaseProvider):
         url = self.base_url.format(date=date_str, cycle=cycle)
 
         logger.info(f"Opening HRRR data from {url}")
-        logger.info(f"Variable: {provider_var}, Forecast hour: {forecast_hour}")
+        logger.info(f"Variable: {provider_var}, Forecast hour(s): {forecast_hours}")
 
         try:
-            # Open Zarr store
-            mapper = fsspec.get_mapper(url, anon=True)
-            ds = xr.open_zarr(mapper, consolidated=True)
+            # Open Zarr store lazily from its (cached) consolidated metadata;
+            # copy so selections never touch the cached dataset
+            ds = _open_zarr_store(url).copy()
 
-            # Select forecast hour
-            if "time" in ds.dims:
-                ds = ds.isel(time=min(forecast_hour, len(ds.time) - 1))
-
-            # Select variable
+            # Select variable first so the time selection touches only its arrays
             if provider_var in ds:
                 ds = ds[[provider_var]]
             else:
@@ -256,6 +606,25 @@ class HRRRZarrProvider(BaseProvider):
                     f"Variable {provider_var} not found. Available: {available}"
                 )
 
+            if from_zarr:
+                # Dask tasks keep a direct reference to the Zarr array instead
+                # of going through xarray's backend wrapper; the raw values
+                # are then masked and scaled as open_zarr would
+                var = ds[provider_var]
+                zarray = _open_zarr_group(url)[provider_var]
+                cf_attrs = {k: var.encoding[k] for k in CF_DECODING_KEYS if k in var.encoding}
+                raw = xr.Variable(
+                    var.dims,
+                    dsa.from_zarr(zarray, chunks=zarray.chunks),
+                    {**var.attrs, **cf_attrs},
+                )
+                decoded = xr.decode_cf(xr.Dataset({provider_var: raw}))
+                ds[provider_var] = var.copy(data=decoded[provider_var].data)
+
+            # Select forecast hour
+            if "time" in ds.dims:
+                ds = ds.isel(time=self._select_times(forecast_hours, ds.sizes["time"]))
+
             # Rename to standard name
             ds = ds.rename({provider_var: variable})
 
@@ -1,61 +1,102 @@
 """I/O utilities for reading and writing weather data."""
 
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, FrozenSet, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import xarray as xr
 
 logger = logging.getLogger(__name__)
 
+# Compression codecs accepted by save_dataset (netCDF-C >= 4.9 filters)
+NETCDF_CODECS = ("zlib", "zstd", "blosc_lz4", "blosc_zstd")
 
-def infer_coord_names(ds: xr.Dataset) -> Dict[str, str]:
-    """
-    Infer coordinate names from dataset.
+# Default Dask chunking for load_dataset; dims missing from a file are ignored
+LOAD_CHUNKS = {"time": 1, "lat": 512, "lon": 512}
+
+# Zarr output: chunk length along lat/lon and number of chunks per shard side
+ZARR_CHUNK_SIZE = 256
+ZARR_CHUNKS_PER_SHARD = 4
+
+# Try to import Zarr v3 codecs for sharded output, but make it optional
+try:
+    from zarr.codecs import BloscCodec
+
+    ZARR_V3_AVAILABLE = True
+except ImportError:
+    logger.debug("Zarr v3 not available. Zarr output is disabled.")
+    ZARR_V3_AVAILABLE = False
 
-    Different datasets use different naming conventions (lat/latitude, lon/longitude, etc.).
-    This function identifies the actual coordinate names.
+
+@lru_cache(maxsize=128)
+def _infer_coord_names(names: FrozenSet[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Pick standard coordinate names from a set of coordinate and dim names.
 
     Args:
-        ds: xarray Dataset
+        names: All coordinate and dimension names of a dataset
 
     Returns:
-        Dictionary mapping standard names to actual coordinate names
+        Tuple of (standard name, actual name) pairs
     """
-    coords = {}
+    coords = []
 
     # Latitude
-    for lat_name in ["latitude", "lat", "y", "rlat"]:
-        if lat_name in ds.coords or lat_name in ds.dims:
-            coords["lat"] = lat_name
+    for lat_name in ("latitude", "lat", "y", "rlat"):
+        if lat_name in names:
+            coords.append(("lat", lat_name))
             break
 
     # Longitude
-    for lon_name in ["longitude", "lon", "x", "rlon"]:
-        if lon_name in ds.coords or lon_name in ds.dims:
-            coords["lon"] = lon_name
+    for lon_name in ("longitude", "lon", "x", "rlon"):
+        if lon_name in names:
+            coords.append(("lon", lon_name))
             break
 
     # Time
-    for time_name in ["time", "valid_time", "forecast_time"]:
-        if time_name in ds.coords or time_name in ds.dims:
-            coords["time"] = time_name
+    for time_name in ("time", "valid_time", "forecast_time"):
+        if time_name in names:
+            coords.append(("time", time_name))
             break
 
+    return tuple(coords)
+
+
+def infer_coord_names(ds: Union[xr.Dataset, xr.DataArray]) -> Dict[str, str]:
+    """
+    Infer coordinate names from dataset.
+
+    Different datasets use different naming conventions (lat/latitude, lon/longitude, etc.).
+    This function identifies the actual coordinate names.
+
+    Args:
+        ds: xarray Dataset or DataArray
+
+    Returns:
+        Dictionary mapping standard names to actual coordinate names
+    """
+    # The result depends only on names, so datasets with the same structure
+    # share one cached lookup
+    coords = dict(_infer_coord_names(frozenset(ds.coords) | frozenset(ds.dims)))
+
     logger.debug(f"Inferred coordinates: {coords}")
     return coords
 
 
-def normalize_longitude(ds: xr.Dataset, lon_name: str = "lon") -> xr.Dataset:
+def normalize_longitude(
+    ds: Union[xr.Dataset, xr.DataArray], lon_name: str = "lon"
+) -> Union[xr.Dataset, xr.DataArray]:
     """
     Normalize longitude coordinates to [-180, 180] range.
 
     Args:
-        ds: xarray Dataset
+        ds: xarray Dataset or DataArray
         lon_name: Name of longitude coordinate
 
     Returns:
-        Dataset with normalized longitudes
+        Dataset (or DataArray) with normalized longitudes
     """
     if lon_name not in ds.coords:
         return ds
@@ -65,6 +106,23 @@ def normalize_longitude(ds: xr.Dataset, lon_name: str = "lon") -> xr.Dataset:
     # Check if longitudes are in [0, 360] range
     if lon_vals.min() >= 0 and lon_vals.max() > 180:
         logger.debug("Converting longitudes from [0, 360] to [-180, 180]")
+
+        if lon_vals.ndim == 1:
+            # Wrapped longitudes of a sorted (possibly rotated) grid are a
+            # rotation of a sorted array, so a roll replaces the full sort
+            new_lon = ((lon_vals + 180) % 360) - 180
+            shift = -int(np.argmin(new_lon))
+            rolled_lon = np.roll(new_lon, shift)
+
+            if np.all(np.diff(rolled_lon) > 0):
+                # Roll along the longitude's dimension, which need not share
+                # its name (e.g. a 'lon' coordinate on an 'x' dimension)
+                ds = ds.roll({ds[lon_name].dims[0]: shift}, roll_coords=True)
+                ds = ds.assign_coords(
+                    {lon_name: (ds[lon_name].dims, rolled_lon, ds[lon_name].attrs)}
+                )
+                return ds
+
         ds = ds.assign_coords({lon_name: ((ds[lon_name] + 180) % 360) - 180})
         ds = ds.sortby(lon_name)
 
@@ -101,8 +159,14 @@ def spatial_subset(
 
     logger.info(f"Subsetting to lat=[{lat_min}, {lat_max}], lon=[{lon_min}, {lon_max}]")
 
-    # Normalize longitudes if needed
-    ds = normalize_longitude(ds, lon_name)
+    # Normalize longitudes only if the request is not already in the
+    # source's [0, 360] convention; selecting natively avoids reordering
+    if lon_name in ds.coords:
+        lon_vals = ds[lon_name].values
+        source_is_0_360 = lon_vals.min() >= 0 and lon_vals.max() > 180
+        request_is_0_360 = lon_min >= 0 and lon_max <= 360
+        if not (source_is_0_360 and request_is_0_360):
+            ds = normalize_longitude(ds, lon_name)
 
     # Perform selection
     subset = ds.sel(
@@ -116,48 +180,197 @@ def spatial_subset(
     return subset
 
 
-def save_dataset(
+def _auto_chunks(shape: Tuple[int, ...], chunk_size: int = 125) -> Tuple[int, ...]:
+    """
+    Choose HDF5 chunk sizes for a variable of the given shape.
+
+    The trailing (up to three) dimensions get chunks of at most chunk_size
+    points; any leading dimensions are chunked one step at a time.
+
+    Args:
+        shape: Variable shape
+        chunk_size: Maximum chunk length along the trailing dimensions
+
+    Returns:
+        Tuple of chunk sizes, one per dimension
+    """
+    n_lead = max(len(shape) - 3, 0)
+    return tuple(
+        1 if i < n_lead else max(min(size, chunk_size), 1)
+        for i, size in enumerate(shape)
+    )
+
+
+def _zarr_chunks_and_shards(shape: Tuple[int, ...]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Choose Zarr chunk and shard shapes for a variable of the given shape.
+
+    The trailing two (lat/lon) dimensions get ZARR_CHUNK_SIZE chunks grouped
+    into shards of up to ZARR_CHUNKS_PER_SHARD chunks per side; leading
+    dimensions (e.g. time) are chunked one step at a time.
+
+    Args:
+        shape: Variable shape
+
+    Returns:
+        Tuple of (chunks, shards)
+    """
+    chunks = []
+    shards = []
+    for i, size in enumerate(shape):
+        if i < len(shape) - 2:
+            chunks.append(1)
+            shards.append(1)
+        else:
+            chunk = max(min(size, ZARR_CHUNK_SIZE), 1)
+            n_chunks = min(ZARR_CHUNKS_PER_SHARD, -(-size // chunk))
+            chunks.append(chunk)
+            shards.append(chunk * max(n_chunks, 1))
+
+    return tuple(chunks), tuple(shards)
+
+
+def _save_zarr(
     ds: xr.Dataset,
     output_path: Path,
-    compression: bool = True,
-    compression_level: int = 4,
+    compression: bool,
+    compression_level: int,
 ) -> None:
     """
-    Save dataset to NetCDF file with optional compression.
+    Save dataset as a sharded Zarr v3 store.
 
     Args:
         ds: xarray Dataset
-        output_path: Output file path
+        output_path: Output store path
         compression: Whether to apply compression
         compression_level: Compression level (1-9)
     """
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if not ZARR_V3_AVAILABLE:
+        raise RuntimeError("Zarr output requires zarr>=3.0")
+
+    encoding = {}
+    for var in ds.data_vars:
+        encoding[var] = {"dtype": "float32"}
+        if ds[var].ndim > 0:
+            chunks, shards = _zarr_chunks_and_shards(ds[var].shape)
+            encoding[var]["chunks"] = chunks
+            encoding[var]["shards"] = shards
+
+            # Dask chunks must line up with shards for a safe parallel write
+            if ds[var].chunks is not None:
+                ds = ds.assign({var: ds[var].chunk(dict(zip(ds[var].dims, shards)))})
+
+        if compression:
+            encoding[var]["compressors"] = [
+                BloscCodec(cname="zstd", clevel=compression_level, shuffle="shuffle")
+            ]
+        else:
+            encoding[var]["compressors"] = None
+
+    ds.to_zarr(output_path, mode="w", encoding=encoding, zarr_format=3, consolidated=True)
+
+
+def _netcdf_encoding(
+    ds: xr.Dataset,
+    compression: bool,
+    compression_level: int,
+    codec: str,
+) -> Dict[str, Dict]:
+    """
+    Build the NetCDF encoding used by save_dataset.
+
+    Args:
+        ds: xarray Dataset
+        compression: Whether to apply compression
+        compression_level: Compression level (1-9)
+        codec: Compression codec (one of NETCDF_CODECS)
 
+    Returns:
+        Encoding dictionary per data variable
+    """
     encoding = {}
     if compression:
         # Apply compression to all data variables
         for var in ds.data_vars:
             encoding[var] = {
-                "zlib": True,
+                "compression": codec,
                 "complevel": compression_level,
+                "shuffle": True,
                 "dtype": "float32",  # Save as float32 to reduce size
             }
+            if ds[var].ndim > 0:
+                encoding[var]["chunksizes"] = _auto_chunks(ds[var].shape)
+
+    return encoding
+
+
+def save_dataset(
+    ds: xr.Dataset,
+    output_path: Path,
+    compression: bool = True,
+    compression_level: int = 4,
+    codec: str = "zlib",
+    output_format: Optional[str] = None,
+) -> None:
+    """
+    Save dataset to NetCDF file (or Zarr store) with optional compression.
+
+    Data variables are written as chunked float32. With zlib the byte-shuffle
+    filter is also applied, which improves the ratio for smooth fields.
+
+    Args:
+        ds: xarray Dataset
+        output_path: Output file path
+        compression: Whether to apply compression
+        compression_level: Compression level (1-9)
+        codec: Compression codec ('zlib', or 'zstd' / 'blosc_lz4' /
+            'blosc_zstd' for much faster writes where the netCDF library
+            supports them). NetCDF output only.
+        output_format: 'netcdf4' or 'zarr'. If None, inferred from the path
+            ('.zarr' suffix selects a sharded Zarr v3 store)
+    """
+    output_path = Path(output_path)
+
+    if output_format is None:
+        output_format = "zarr" if output_path.suffix == ".zarr" else "netcdf4"
+
+    if output_format not in ("netcdf4", "zarr"):
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    # The codec only applies to NetCDF output
+    if output_format == "netcdf4" and codec not in NETCDF_CODECS:
+        raise ValueError(f"Unknown compression codec: {codec}. Available: {NETCDF_CODECS}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Saving dataset to {output_path}")
-    ds.to_netcdf(output_path, encoding=encoding, engine="netcdf4")
 
-    # Report file size
-    file_size_mb = output_path.stat().st_size / (1024 * 1024)
+    if output_format == "zarr":
+        _save_zarr(ds, output_path, compression, compression_level)
+    else:
+        encoding = _netcdf_encoding(ds, compression, compression_level, codec)
+        ds.to_netcdf(output_path, encoding=encoding, engine="netcdf4")
+
+    # Report file size (a Zarr store is a directory of objects)
+    if output_path.is_dir():
+        size_bytes = sum(f.stat().st_size for f in output_path.rglob("*") if f.is_file())
+    else:
+        size_bytes = output_path.stat().st_size
+    file_size_mb = size_bytes / (1024 * 1024)
     logger.info(f"Saved {file_size_mb:.2f} MB")
 
 
-def load_dataset(file_path: Path) -> xr.Dataset:
+def load_dataset(file_path: Path, chunks: Optional[Dict[str, int]] = None) -> xr.Dataset:
     """
-    Load dataset from NetCDF file.
+    Load dataset from NetCDF file lazily as Dask arrays.
+
+    Nothing beyond metadata is read until values are needed; call ``.load()``
+    on the result to read everything into memory.
 
     Args:
         file_path: Path to NetCDF file
+        chunks: Optional Dask chunk sizes (defaults to LOAD_CHUNKS). Pass
+            ``{}`` to use the file's own chunking.
 
     Returns:
         xarray Dataset
@@ -167,13 +380,60 @@ def load_dataset(file_path: Path) -> xr.Dataset:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
+    if chunks is None:
+        chunks = LOAD_CHUNKS
+
     logger.info(f"Loading dataset from {file_path}")
-    ds = xr.open_dataset(file_path, engine="netcdf4")
+    ds = xr.open_dataset(file_path, engine="netcdf4", chunks=chunks, cache=False)
 
     logger.info(f"Loaded dataset with shape: {dict(ds.sizes)}")
     return ds
 
 
+def load_ensemble(
+    file_paths: Sequence[Path],
+    chunks: Optional[Dict[str, int]] = None,
+) -> xr.Dataset:
+    """
+    Load several NetCDF files as one dataset stacked along a 'model' dimension.
+
+    Files are opened in parallel with Dask and concatenated lazily, so no data
+    is read until a computation needs it. All files must share the same grid.
+
+    Args:
+        file_paths: Paths to NetCDF files, one per ensemble member
+        chunks: Optional Dask chunk sizes (defaults to one chunk per file)
+
+    Returns:
+        xarray Dataset with a leading 'model' dimension
+    """
+    paths = [Path(p) for p in file_paths]
+
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+    logger.info(f"Loading ensemble of {len(paths)} datasets")
+
+    try:
+        ds = xr.open_mfdataset(
+            paths,
+            engine="netcdf4",
+            combine="nested",
+            concat_dim="model",
+            parallel=True,
+            chunks=chunks,
+            coords="minimal",
+            compat="override",
+            join="override",
+        )
+    except ValueError as e:
+        raise ValueError(f"Ensemble files must share the same grid: {e}")
+
+    logger.info(f"Loaded ensemble with shape: {dict(ds.sizes)}")
+    return ds
+
+
 def get_variable_metadata(ds: xr.Dataset, var_name: str) -> Dict[str, str]:
     """
     Extract metadata for a variable.
@@ -1,8 +1,13 @@
 """Regridding utilities using xESMF."""
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import xarray as xr
@@ -12,6 +17,42 @@ from weather_data_tool.io import infer_coord_names
 
 logger = logging.getLogger(__name__)
 
+# Number of regridders (and their sparse weight matrices) kept in memory
+REGRIDDER_CACHE_SIZE = 8
+
+# Regridders by (source grid key, target grid key, build options)
+_REGRIDDER_CACHE: "OrderedDict[Tuple, xe.Regridder]" = OrderedDict()
+_REGRIDDER_CACHE_LOCK = threading.Lock()
+
+# Coordinates that define a horizontal grid for xESMF
+GRID_COORDS = ("lat", "lon", "lat_b", "lon_b")
+
+# Non-horizontal dims regridded one step at a time
+REGRID_TILE_DIMS = ("time", "level")
+
+# Temporary dimension used to regrid several variables in one call
+STACK_DIM = "_var"
+
+
+def _grid_axis(start: float, stop: float, resolution: float) -> np.ndarray:
+    """
+    Build evenly spaced grid points from start up to (at most) stop.
+
+    The point count is computed once, with a small tolerance for floating
+    point error, so the same bounds always give the same grid (and the
+    same cached regridder).
+
+    Args:
+        start: First grid point
+        stop: Last allowed grid point
+        resolution: Grid spacing
+
+    Returns:
+        1D float64 array of grid points
+    """
+    n_points = int(np.floor((stop - start) / resolution + 1e-9)) + 1
+    return np.linspace(start, start + (n_points - 1) * resolution, n_points, dtype=np.float64)
+
 
 def create_reference_grid(
     lat_min: float,
@@ -40,8 +81,8 @@ def create_reference_grid(
     )
 
     # Create coordinate arrays
-    lats = np.arange(lat_min, lat_max + resolution, resolution)
-    lons = np.arange(lon_min, lon_max + resolution, resolution)
+    lats = _grid_axis(lat_min, lat_max, resolution)
+    lons = _grid_axis(lon_min, lon_max, resolution)
 
     # Create grid dataset
     ds_grid = xr.Dataset(
@@ -92,16 +133,29 @@ def get_grid_from_config(config: Dict, grid_name: str, region_name: str) -> xr.D
     )
 
 
-def prepare_dataset_for_regridding(ds: xr.Dataset) -> Tuple[xr.Dataset, Dict[str, str]]:
+def prepare_dataset_for_regridding(
+    ds: xr.Dataset,
+    keep_vars: Optional[Sequence[str]] = None,
+) -> Tuple[xr.Dataset, Dict[str, str]]:
     """
     Prepare dataset for regridding by standardizing coordinate names.
 
     Args:
         ds: Input dataset
+        keep_vars: Data variables to keep (None keeps all). Dropping the
+            rest means the regridder never copies them; pass an empty list
+            to keep only the grid coordinates
 
     Returns:
         Tuple of (prepared dataset, coordinate name mapping)
     """
+    if keep_vars is not None:
+        keep = set(keep_vars)
+        missing = keep - set(ds.data_vars)
+        if missing:
+            raise ValueError(f"Variables not found in dataset: {sorted(missing)}")
+        ds = ds.drop_vars([var for var in ds.data_vars if var not in keep])
+
     coord_names = infer_coord_names(ds)
 
     # Rename coordinates to standard names if needed
@@ -118,6 +172,167 @@ def prepare_dataset_for_regridding(ds: xr.Dataset) -> Tuple[xr.Dataset, Dict[str
     return ds, coord_names
 
 
+def _grid_key(ds: xr.Dataset) -> Tuple:
+    """
+    Build a small hashable key from the grid coordinates of a dataset.
+
+    Coordinates are represented by a digest of their values, so keys stay a
+    few bytes even for large curvilinear grids.
+
+    Args:
+        ds: Dataset with standard 'lat'/'lon' (and optional bounds) coordinates
+
+    Returns:
+        Tuple of (name, dims, shape, dtype, digest) per grid coordinate
+    """
+    key = []
+    for name in GRID_COORDS:
+        if name in ds.variables:
+            values = np.ascontiguousarray(ds[name].values)
+            digest = hashlib.blake2b(values.data, digest_size=16).hexdigest()
+            key.append((name, ds[name].dims, values.shape, values.dtype.str, digest))
+
+    return tuple(key)
+
+
+def _grid_only(ds: xr.Dataset) -> xr.Dataset:
+    """
+    Get a coordinate-only dataset holding the grid coordinates of a dataset.
+
+    Args:
+        ds: Dataset with standard 'lat'/'lon' (and optional bounds) coordinates
+
+    Returns:
+        Dataset holding only the grid coordinates
+    """
+    coords = {
+        name: (ds[name].dims, ds[name].values) for name in GRID_COORDS if name in ds.variables
+    }
+    return xr.Dataset(coords=coords)
+
+
+def _build_regridder(
+    ds_src: xr.Dataset,
+    ds_tgt: xr.Dataset,
+    method: str,
+    periodic: bool = False,
+    reuse_weights: bool = False,
+    filename: Optional[str] = None,
+    src_key: Optional[Tuple] = None,
+    tgt_key: Optional[Tuple] = None,
+) -> xe.Regridder:
+    """
+    Build an xESMF regridder, memoized on the source and target grids.
+
+    Up to REGRIDDER_CACHE_SIZE regridders are kept, least recently used
+    first out. Only the grid keys are held by the cache, not the grids.
+
+    Args:
+        ds_src: Source dataset with standard coordinate names
+        ds_tgt: Target grid with standard coordinate names
+        method: Regridding method
+        periodic: Whether longitude is periodic
+        reuse_weights: Whether to reuse the weights file if available
+        filename: Optional weights file path
+        src_key: Source grid key from _grid_key (computed if None)
+        tgt_key: Target grid key from _grid_key (computed if None)
+
+    Returns:
+        Regridder holding the sparse weight matrix
+    """
+    if src_key is None:
+        src_key = _grid_key(ds_src)
+    if tgt_key is None:
+        tgt_key = _grid_key(ds_tgt)
+    key = (src_key, tgt_key, method, periodic, reuse_weights, filename)
+
+    with _REGRIDDER_CACHE_LOCK:
+        if key in _REGRIDDER_CACHE:
+            _REGRIDDER_CACHE.move_to_end(key)
+            return _REGRIDDER_CACHE[key]
+
+    logger.info("Building regridder (this may take a moment on first run)...")
+
+    regridder = xe.Regridder(
+        _grid_only(ds_src),
+        _grid_only(ds_tgt),
+        method=method,
+        periodic=periodic,
+        reuse_weights=reuse_weights,
+        filename=filename,
+    )
+
+    with _REGRIDDER_CACHE_LOCK:
+        _REGRIDDER_CACHE[key] = regridder
+        while len(_REGRIDDER_CACHE) > REGRIDDER_CACHE_SIZE:
+            _REGRIDDER_CACHE.popitem(last=False)
+
+    return regridder
+
+
+def _apply_regridder(
+    regridder: xe.Regridder,
+    ds_in: xr.Dataset,
+    ds_in_prep: xr.Dataset,
+    ds_target_prep: xr.Dataset,
+    method: str,
+) -> xr.Dataset:
+    """
+    Apply a regridder to a prepared dataset and record regridding metadata.
+
+    Args:
+        regridder: Regridder built for the source and target grids
+        ds_in: Original input dataset (for global attributes)
+        ds_in_prep: Input dataset with standardized coordinate names
+        ds_target_prep: Target grid with standardized coordinate names
+        method: Regridding method used to build the regridder
+
+    Returns:
+        Regridded dataset
+    """
+    # Regrid in float32 (the precision outputs are saved in) to halve the
+    # memory traffic of the sparse multiply
+    ds_in_prep = ds_in_prep.assign(
+        {
+            var: ds_in_prep[var].astype(np.float32, copy=False)
+            for var in ds_in_prep.data_vars
+            if np.issubdtype(ds_in_prep[var].dtype, np.floating)
+        }
+    )
+
+    # Tile over non-horizontal dims so each sparse multiply works on one
+    # cache-sized 2D field; in-memory inputs are computed back eagerly
+    tile_chunks = {dim: 1 for dim in REGRID_TILE_DIMS if dim in ds_in_prep.dims}
+    lazy_input = any(ds_in_prep[var].chunks is not None for var in ds_in_prep.data_vars)
+    if tile_chunks:
+        ds_in_prep = ds_in_prep.chunk(tile_chunks)
+
+    # Apply regridding to all data variables. Variables with the same dims
+    # and dtype are stacked so one sparse multiply covers all of them
+    data_vars = list(ds_in_prep.data_vars)
+    layouts = {(ds_in_prep[var].dims, ds_in_prep[var].dtype) for var in data_vars}
+    if len(data_vars) > 1 and len(layouts) == 1:
+        stacked = ds_in_prep.to_array(dim=STACK_DIM)
+        ds_out = regridder(stacked, keep_attrs=True).to_dataset(dim=STACK_DIM)
+        for var in data_vars:
+            ds_out[var].attrs = ds_in_prep[var].attrs
+    else:
+        ds_out = regridder(ds_in_prep, keep_attrs=True)
+
+    if tile_chunks and not lazy_input:
+        ds_out = ds_out.load()
+
+    logger.info(f"Regridding complete. Output shape: {dict(ds_out.sizes)}")
+
+    # Copy global attributes
+    ds_out.attrs.update(ds_in.attrs)
+    ds_out.attrs["regrid_method"] = method
+    ds_out.attrs["regrid_source_shape"] = str(dict(ds_in_prep.sizes))
+    ds_out.attrs["regrid_target_shape"] = str(dict(ds_target_prep.sizes))
+
+    return ds_out
+
+
 def regrid_dataset(
     ds_in: xr.Dataset,
     ds_target: xr.Dataset,
@@ -125,6 +340,7 @@ def regrid_dataset(
     periodic: bool = False,
     reuse_weights: bool = True,
     weights_dir: Optional[Path] = None,
+    variables: Optional[List[str]] = None,
 ) -> xr.Dataset:
     """
     Regrid dataset to target grid using xESMF.
@@ -136,15 +352,16 @@ def regrid_dataset(
         periodic: Whether longitude is periodic (wraps at 360°)
         reuse_weights: Whether to reuse weights if available
         weights_dir: Directory to store/load regridding weights
+        variables: Data variables to regrid (None regrids all)
 
     Returns:
         Regridded dataset
     """
     logger.info(f"Starting regridding with method: {method}")
 
-    # Prepare source dataset
-    ds_in_prep, _ = prepare_dataset_for_regridding(ds_in)
-    ds_target_prep, _ = prepare_dataset_for_regridding(ds_target)
+    # Prepare source dataset; only the grid coordinates of the target matter
+    ds_in_prep, _ = prepare_dataset_for_regridding(ds_in, keep_vars=variables)
+    ds_target_prep, _ = prepare_dataset_for_regridding(ds_target, keep_vars=[])
 
     # Log grid info
     logger.info(
@@ -168,12 +385,12 @@ def regrid_dataset(
                 weights_dir / f"weights_{method}_{src_shape}_to_{tgt_shape}.nc"
             )
 
-        logger.info("Building regridder (this may take a moment on first run)...")
-
-        regridder = xe.Regridder(
+        # Regridders are cached in memory, so repeated calls on the same
+        # grids skip both weight generation and weight file reads
+        regridder = _build_regridder(
             ds_in_prep,
             ds_target_prep,
-            method=method,
+            method,
             periodic=periodic,
             reuse_weights=reuse_weights,
             filename=str(weights_filename) if weights_filename else None,
@@ -181,18 +398,7 @@ def regrid_dataset(
 
         logger.info("Regridder created successfully")
 
-        # Apply regridding to all data variables
-        ds_out = regridder(ds_in_prep, keep_attrs=True)
-
-        logger.info(f"Regridding complete. Output shape: {dict(ds_out.sizes)}")
-
-        # Copy global attributes
-        ds_out.attrs.update(ds_in.attrs)
-        ds_out.attrs["regrid_method"] = method
-        ds_out.attrs["regrid_source_shape"] = str(dict(ds_in_prep.sizes))
-        ds_out.attrs["regrid_target_shape"] = str(dict(ds_target_prep.sizes))
-
-        return ds_out
+        return _apply_regridder(regridder, ds_in, ds_in_prep, ds_target_prep, method)
 
     except Exception as e:
         logger.error(f"Regridding failed: {e}")
@@ -203,6 +409,7 @@ def regrid_to_common_grid(
     datasets: list[xr.Dataset],
     reference_grid: xr.Dataset,
     method: str = "bilinear",
+    regridder: Optional[xe.Regridder] = None,
 ) -> list[xr.Dataset]:
     """
     Regrid multiple datasets to a common grid.
@@ -211,16 +418,65 @@ def regrid_to_common_grid(
         datasets: List of datasets to regrid
         reference_grid: Common target grid
         method: Regridding method
+        regridder: Prebuilt regridder to apply to every dataset (all datasets
+            must then share its source grid; its method overrides `method`).
+            If None, one is built per distinct source grid.
 
     Returns:
         List of regridded datasets
     """
     logger.info(f"Regridding {len(datasets)} datasets to common grid")
 
-    regridded = []
-    for i, ds in enumerate(datasets):
+    prepared = [prepare_dataset_for_regridding(ds)[0] for ds in datasets]
+    ds_target_prep, _ = prepare_dataset_for_regridding(reference_grid, keep_vars=[])
+    tgt_key = _grid_key(ds_target_prep)
+
+    src_keys = [_grid_key(ds_prep) for ds_prep in prepared]
+
+    if regridder is not None:
+        # A prebuilt regridder only fits datasets on the grid it was built for
+        if len(set(src_keys)) > 1:
+            raise ValueError("A prebuilt regridder requires all datasets to share one grid")
+        src_shape = (len(prepared[0].lat), len(prepared[0].lon))
+        if tuple(regridder.shape_in) != src_shape:
+            raise ValueError(
+                f"Regridder input shape {tuple(regridder.shape_in)} does not match "
+                f"the dataset grid {src_shape}"
+            )
+        regridders = {src_keys[0]: regridder}
+        method = regridder.method
+    else:
+        # Build one regridder per distinct source grid, so datasets that share
+        # a grid also share the weights
+        regridders = {}
+        for ds_prep, src_key in zip(prepared, src_keys):
+            if src_key not in regridders:
+                # No weights file is involved, so there are no weights to reuse
+                regridders[src_key] = _build_regridder(
+                    ds_prep,
+                    ds_target_prep,
+                    method,
+                    periodic=False,
+                    reuse_weights=False,
+                    filename=None,
+                    src_key=src_key,
+                    tgt_key=tgt_key,
+                )
+
+        logger.info(f"Built {len(regridders)} regridder(s) for {len(datasets)} datasets")
+
+    def _regrid_one(i: int) -> xr.Dataset:
         logger.info(f"Regridding dataset {i+1}/{len(datasets)}")
-        ds_regridded = regrid_dataset(ds, reference_grid, method=method)
-        regridded.append(ds_regridded)
+        try:
+            return _apply_regridder(
+                regridders[src_keys[i]], datasets[i], prepared[i], ds_target_prep, method
+            )
+        except Exception as e:
+            logger.error(f"Regridding failed: {e}")
+            raise RuntimeError(f"Failed to regrid dataset {i}: {e}")
+
+    # The sparse weight multiplication releases the GIL, so threads scale
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        regridded = list(executor.map(_regrid_one, range(len(datasets))))
 
     return regridded
@@ -1,7 +1,7 @@
 """Utility functions for WeatherDataTool."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -9,6 +9,12 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Use libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def setup_logging(level: str = "INFO") -> None:
     """
@@ -42,7 +48,7 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     logger.debug(f"Loading configuration from {config_path}")
 
     with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
     return config
 
@@ -51,6 +57,9 @@ def parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
     """
     Parse ISO datetime string.
 
+    Strings with a UTC offset (or a trailing 'Z') are converted to naive UTC,
+    matching the naive UTC run times used by the providers.
+
     Args:
         dt_str: ISO format datetime string (e.g., "2024-01-15T12:00:00")
 
@@ -60,12 +69,20 @@ def parse_datetime(dt_str: Optional[str]) -> Optional[datetime]:
     if dt_str is None:
         return None
 
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11
+    if dt_str.endswith("Z"):
+        dt_str = dt_str[:-1] + "+00:00"
+
     try:
-        return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(dt_str)
     except ValueError:
         logger.error(f"Invalid datetime format: {dt_str}")
         raise
 
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
 
 def format_run_time(dt: datetime) -> str:
     """
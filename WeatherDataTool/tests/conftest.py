@@ -1,8 +1,40 @@
 """Pytest fixtures for WeatherDataTool tests."""
 
+import contextlib
+import importlib
+
 import numpy as np
 import pytest
 import xarray as xr
+import xesmf as xe
+
+
+def _readonly(values: np.ndarray) -> np.ndarray:
+    """Mark a shared coordinate array read-only so no test can modify it."""
+    values.setflags(write=False)
+    return values
+
+
+# Coordinates shared by the fixtures below (10x10 small grid, 20x30 medium
+# grid, 5 time steps)
+_LATS_SMALL = _readonly(np.linspace(40, 50, 10))
+_LONS_SMALL = _readonly(np.linspace(-10, 10, 10))
+_LATS_MED = _readonly(np.linspace(35, 55, 20))
+_LONS_MED = _readonly(np.linspace(-15, 15, 30))
+_TIMES = _readonly(np.arange(0, 5))
+
+
+# Heavy backends (some optional) imported up front so their import cost is
+# not charged to whichever test happens to use them first
+WARM_IMPORTS = ("h5netcdf", "numba", "zarr")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_imports():
+    """Import heavy optional modules once, before the first test runs."""
+    for module in WARM_IMPORTS:
+        with contextlib.suppress(ImportError):
+            importlib.import_module(module)
 
 
 @pytest.fixture
@@ -56,16 +88,15 @@ def sample_config():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataset_small():
     """Create a small synthetic dataset (10x10 grid)."""
     # Create coordinates
-    lats = np.linspace(40, 50, 10)
-    lons = np.linspace(-10, 10, 10)
+    lats = _LATS_SMALL
+    lons = _LONS_SMALL
 
     # Create a simple linear temperature field
-    lon_grid, lat_grid = np.meshgrid(lons, lats)
-    t2m_data = 273.15 + 10 + 0.5 * lat_grid + 0.3 * lon_grid  # Realistic temps in K
+    t2m_data = 273.15 + 10 + 0.5 * lats[:, None] + 0.3 * lons[None, :]  # Realistic temps in K
 
     # Create dataset
     ds = xr.Dataset(
@@ -92,23 +123,25 @@ def sample_dataset_small():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataset_medium():
     """Create a medium synthetic dataset with multiple variables."""
-    lats = np.linspace(35, 55, 20)
-    lons = np.linspace(-15, 15, 30)
+    lats = _LATS_MED
+    lons = _LONS_MED
 
-    lon_grid, lat_grid = np.meshgrid(lons, lats)
+    lat_col = lats[:, None]
+    lon_row = lons[None, :]
+    shape = (len(lats), len(lons))
 
     # Temperature
-    t2m = 273.15 + 10 + 0.5 * lat_grid + 0.3 * lon_grid
+    t2m = 273.15 + 10 + 0.5 * lat_col + 0.3 * lon_row
 
-    # Wind components
-    u10 = 5 + 0.1 * lon_grid
-    v10 = 3 + 0.1 * lat_grid
+    # Wind components (each varies along one axis only)
+    u10 = np.broadcast_to(5 + 0.1 * lon_row, shape).copy()
+    v10 = np.broadcast_to(3 + 0.1 * lat_col, shape).copy()
 
     # Precipitation (always positive)
-    tp = np.abs(0.1 * np.sin(lat_grid / 10) * np.cos(lon_grid / 10))
+    tp = np.abs(0.1 * np.sin(lat_col / 10) * np.cos(lon_row / 10))
 
     ds = xr.Dataset(
         {
@@ -132,18 +165,21 @@ def sample_dataset_medium():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataset_with_time():
     """Create a dataset with time dimension."""
-    lats = np.linspace(40, 50, 10)
-    lons = np.linspace(-10, 10, 10)
-    times = np.arange(0, 5)  # 5 time steps
-
-    # Create 3D data (time, lat, lon)
-    t2m = np.zeros((len(times), len(lats), len(lons)))
-    for t in range(len(times)):
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
-        t2m[t] = 273.15 + 10 + 0.5 * lat_grid + 0.3 * lon_grid + t
+    lats = _LATS_SMALL
+    lons = _LONS_SMALL
+    times = _TIMES  # 5 time steps
+
+    # Create 3D data (time, lat, lon) by broadcasting 1D vectors
+    t2m = (
+        273.15
+        + 10
+        + 0.5 * lats[None, :, None]
+        + 0.3 * lons[None, None, :]
+        + times[:, None, None]
+    )
 
     ds = xr.Dataset(
         {
@@ -161,39 +197,50 @@ def sample_dataset_with_time():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_datasets_ensemble():
     """Create multiple datasets for ensemble testing."""
-    lats = np.linspace(40, 50, 10)
-    lons = np.linspace(-10, 10, 10)
+    lats = _LATS_SMALL
+    lons = _LONS_SMALL
 
-    datasets = []
+    # Seeded so the session-scoped members are reproducible
+    rng = np.random.default_rng(0)
 
-    # Create 3 ensemble members with slightly different values
-    for i in range(3):
-        lon_grid, lat_grid = np.meshgrid(lons, lats)
+    # All 3 members in one array: same base field, offset per member, plus
+    # small noise
+    base = 273.15 + 10 + 0.5 * lats[:, None] + 0.3 * lons[None, :]
+    offsets = 0.5 * np.arange(3)[:, None, None]
+    t2m_all = base + offsets + 0.2 * rng.standard_normal((3, len(lats), len(lons)))
 
-        # Add some variation between ensemble members
-        t2m = 273.15 + 10 + 0.5 * lat_grid + 0.3 * lon_grid + i * 0.5
-        t2m += np.random.normal(0, 0.2, t2m.shape)  # Add small noise
-
-        ds = xr.Dataset(
+    datasets = [
+        xr.Dataset(
             {
-                "t2m": (["lat", "lon"], t2m),
+                "t2m": (["lat", "lon"], t2m, {"long_name": "2m temperature", "units": "K"}),
             },
             coords={
                 "lat": (["lat"], lats),
                 "lon": (["lon"], lons),
             },
         )
-
-        ds["t2m"].attrs = {"long_name": "2m temperature", "units": "K"}
-        datasets.append(ds)
+        for t2m in t2m_all
+    ]
 
     return datasets
 
 
+@pytest.fixture(scope="session")
+def sample_datasets_ensemble_dask(sample_datasets_ensemble):
+    """Ensemble members chunked with Dask, to exercise the lazy code paths."""
+    return [ds.chunk({"lat": 5, "lon": 5}) for ds in sample_datasets_ensemble]
+
+
 @pytest.fixture
+def datasets(request):
+    """Ensemble fixture chosen by name via indirect parametrization."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture(scope="session")
 def reference_grid_small():
     """Create a small reference grid for regridding tests."""
     lats = np.linspace(40, 50, 5)  # Coarser than sample_dataset_small
@@ -209,7 +256,7 @@ def reference_grid_small():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def reference_grid_different():
     """Create a reference grid with different extent."""
     lats = np.linspace(42, 48, 8)
@@ -225,6 +272,12 @@ def reference_grid_different():
     return ds
 
 
+@pytest.fixture(scope="session")
+def regrid_weights(sample_datasets_ensemble, reference_grid_small):
+    """Build the bilinear ensemble-to-reference regridder once per session."""
+    return xe.Regridder(sample_datasets_ensemble[0], reference_grid_small, method="bilinear")
+
+
 @pytest.fixture
 def tmp_output_dir(tmp_path):
     """Create temporary output directory."""
@@ -1,39 +1,131 @@
 """Tests for analyze module."""
 
+import io
+import itertools
 import json
 
 import numpy as np
 import pytest
+import xarray as xr
 
+from weather_data_tool import analyze
 from weather_data_tool.analyze import (
+    ORJSON_AVAILABLE,
+    _ensemble_mean_std,
+    _field_statistics,
+    _welford_mean_std,
     analyze_datasets,
     compute_ensemble_spread,
     compute_pairwise_differences,
     create_spread_map,
+    dumps_analysis_json,
     export_analysis_json,
     find_top_spread_locations,
 )
 
 
-def test_compute_ensemble_spread(sample_datasets_ensemble):
-    """Test ensemble spread computation."""
+@pytest.mark.parametrize(
+    "datasets",
+    ["sample_datasets_ensemble", "sample_datasets_ensemble_dask"],
+    indirect=True,
+)
+def test_compute_ensemble_spread(datasets):
+    """Test ensemble spread computation for in-memory and Dask members."""
     mean, std, stacked = compute_ensemble_spread(
-        sample_datasets_ensemble,
+        datasets,
         "t2m",
+        return_stacked=True,
     )
 
     # Check shapes
-    assert mean.shape == sample_datasets_ensemble[0]["t2m"].shape
-    assert std.shape == sample_datasets_ensemble[0]["t2m"].shape
+    assert mean.shape == datasets[0]["t2m"].shape
+    assert std.shape == datasets[0]["t2m"].shape
 
     # Check that std is non-negative
     assert (std >= 0).all()
 
     # Check that stacked has model dimension
     assert "model" in stacked.dims
+    assert stacked.sizes["model"] == len(datasets)
+
+
+def test_compute_ensemble_spread_matches_xarray(sample_datasets_ensemble):
+    """Test numpy reductions agree with xarray's mean/std over models."""
+    datasets = [ds.copy(deep=True) for ds in sample_datasets_ensemble]
+    datasets[1]["t2m"][0, 0] = np.nan  # NaNs must be skipped like xarray does
+
+    mean, std = compute_ensemble_spread(datasets, "t2m")
+
+    reference = xr.concat([ds["t2m"] for ds in datasets], dim="model")
+    np.testing.assert_allclose(mean.values, reference.mean(dim="model").values)
+    np.testing.assert_allclose(std.values, reference.std(dim="model").values)
+    assert mean.dims == reference.dims[1:]
+
+
+def test_numba_kernel_matches_numpy(sample_datasets_ensemble):
+    """Test the Numba spread kernel agrees with the numpy Welford pass."""
+    pytest.importorskip("numba")
+
+    values = np.stack([ds["t2m"].values for ds in sample_datasets_ensemble])
+    values[0, 0, 0] = np.nan
+    values[:, 1, 1] = np.nan  # No valid samples at this point
+
+    mean_ref, std_ref = _welford_mean_std(values)
+
+    # Both the member-list and the stacked-array kernels
+    for arrays in (list(values), values):
+        mean, std = _ensemble_mean_std(arrays)
+
+        np.testing.assert_allclose(mean, mean_ref, equal_nan=True)
+        np.testing.assert_allclose(std, std_ref, equal_nan=True)
+        assert np.isnan(std[1, 1])
+
+
+def test_field_statistics_matches_numpy(sample_datasets_ensemble):
+    """Test the one-pass field statistics agree with numpy reductions."""
+    values = sample_datasets_ensemble[0]["t2m"].values.copy()
+    values[0, 0] = np.nan
+
+    expected = (
+        np.nanmean(values),
+        np.nanstd(values),
+        np.nanmin(values),
+        np.nanmax(values),
+    )
+
+    np.testing.assert_allclose(_field_statistics(values), expected)
+
+
+def test_compute_ensemble_spread_keeps_float32(sample_datasets_ensemble):
+    """Test float32 inputs are not promoted to float64 results."""
+    datasets = [ds.astype(np.float32) for ds in sample_datasets_ensemble]
+
+    mean, std, stacked = compute_ensemble_spread(datasets, "t2m", return_stacked=True)
+
+    assert stacked.dtype == np.float32
+    assert mean.dtype == np.float32
+    assert std.dtype == np.float32
+
+
+def test_compute_ensemble_spread_prestacked(sample_datasets_ensemble):
+    """Test spread from a dataset already stacked along 'model'."""
+    ensemble = xr.concat(sample_datasets_ensemble, dim="model")
+
+    mean, std, stacked = compute_ensemble_spread(ensemble, "t2m", return_stacked=True)
+    mean_ref, std_ref = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
+
+    np.testing.assert_allclose(mean.values, mean_ref.values)
+    np.testing.assert_allclose(std.values, std_ref.values)
     assert stacked.sizes["model"] == len(sample_datasets_ensemble)
 
 
+def test_compute_ensemble_spread_without_stacked(sample_datasets_ensemble):
+    """Test the stacked ensemble is only returned on request."""
+    result = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
+
+    assert len(result) == 2
+
+
 def test_compute_ensemble_spread_single_dataset(sample_datasets_ensemble):
     """Test error handling with single dataset."""
     with pytest.raises(ValueError, match="at least 2 datasets"):
@@ -55,13 +147,9 @@ def test_compute_pairwise_differences(sample_datasets_ensemble):
         labels=labels,
     )
 
-    # Check that we have the right number of pairs
-    n_datasets = len(sample_datasets_ensemble)
-    n_pairs = n_datasets * (n_datasets - 1) // 2
-    assert len(differences) == n_pairs
-
-    # Check keys
-    assert "Model_A_minus_Model_B" in differences
+    # Check that we have exactly one key per pair of models
+    expected = {f"{a}_minus_{b}" for a, b in itertools.combinations(labels, 2)}
+    assert set(differences) == expected
 
     # Check shapes
     for diff in differences.values():
@@ -76,12 +164,30 @@ def test_compute_pairwise_differences_no_labels(sample_datasets_ensemble):
     )
 
     # Should generate default labels
-    assert "Model_0_minus_Model_1" in differences
+    n_datasets = len(sample_datasets_ensemble)
+    expected = {
+        f"Model_{a}_minus_Model_{b}"
+        for a, b in itertools.combinations(range(n_datasets), 2)
+    }
+    assert set(differences) == expected
+
+
+def test_compute_pairwise_differences_summary(sample_datasets_ensemble):
+    """Test eager summaries agree with the lazily computed differences."""
+    differences = compute_pairwise_differences(sample_datasets_ensemble, "t2m")
+
+    assert set(differences.summary) == set(differences)
+
+    key = "Model_0_minus_Model_2"
+    expected = sample_datasets_ensemble[0]["t2m"] - sample_datasets_ensemble[2]["t2m"]
+    np.testing.assert_allclose(differences[key].values, expected.values)
+    assert differences.summary[key]["mean_diff"] == pytest.approx(float(expected.mean()))
+    assert differences[key] is differences[key]  # Cached after first access
 
 
 def test_find_top_spread_locations(sample_datasets_ensemble):
     """Test finding top spread locations."""
-    _, spread, _ = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
+    _, spread = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
 
     locations = find_top_spread_locations(spread, top_n=3)
 
@@ -94,29 +200,39 @@ def test_find_top_spread_locations(sample_datasets_ensemble):
         assert "spread" in loc
 
     # Check that spreads are in descending order
-    spreads = [loc["spread"] for loc in locations]
-    assert spreads == sorted(spreads, reverse=True)
+    spreads = np.fromiter((loc["spread"] for loc in locations), dtype=float, count=len(locations))
+    assert np.all(np.diff(spreads) <= 0)
+
+
+def test_find_top_spread_locations_coordinates(sample_datasets_ensemble):
+    """Test the top location reports the coordinates of the maximum."""
+    _, spread = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
+
+    top = find_top_spread_locations(spread, top_n=1)[0]
+    expected = spread.where(spread == spread.max(), drop=True)
 
+    assert top["lat"] == float(expected["lat"][0])
+    assert top["lon"] == float(expected["lon"][0])
+    assert top["spread"] == float(spread.max())
 
-def test_create_spread_map(sample_datasets_ensemble, tmp_output_dir):
+
+def test_create_spread_map(sample_datasets_ensemble):
     """Test creating spread map visualization."""
-    _, spread, _ = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
+    _, spread = compute_ensemble_spread(sample_datasets_ensemble, "t2m")
 
-    output_file = tmp_output_dir / "spread_map.png"
+    buffer = io.BytesIO()
 
     create_spread_map(
         spread,
-        output_file,
+        buffer,
         title="Test Spread Map",
         variable_name="t2m",
         units="K",
     )
 
-    # Check that file was created
-    assert output_file.exists()
-
-    # Check file size is reasonable (should be a valid PNG)
-    assert output_file.stat().st_size > 1000  # At least 1KB
+    # Check that a PNG was written
+    buffer.seek(0)
+    assert buffer.read(8) == b"\x89PNG\r\n\x1a\n"
 
 
 def test_analyze_datasets(sample_datasets_ensemble, tmp_output_dir):
@@ -197,3 +313,44 @@ def test_export_analysis_json(sample_datasets_ensemble, tmp_output_dir):
     assert loaded_results["variable"] == "t2m"
     assert loaded_results["n_models"] == 3
     assert "spread_statistics" in loaded_results
+
+
+@pytest.mark.parametrize(
+    "use_orjson",
+    [
+        pytest.param(
+            True, marks=pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+        ),
+        False,
+    ],
+)
+def test_dumps_analysis_json_non_finite(monkeypatch, use_orjson):
+    """Test NaN and Inf statistics are written as null by both backends."""
+    monkeypatch.setattr(analyze, "ORJSON_AVAILABLE", use_orjson)
+    results = {
+        "spread_statistics": {"mean": float("nan"), "max": np.float64(np.inf)},
+        "values": np.array([1.0, np.nan]),
+        "model_means": [np.float32(np.nan)],
+    }
+
+    document = dumps_analysis_json(results)
+
+    loaded_results = json.loads(document, parse_constant=pytest.fail)
+    assert loaded_results["spread_statistics"] == {"mean": None, "max": None}
+    assert loaded_results["values"] == [1.0, None]
+    assert loaded_results["model_means"] == [None]
+
+
+def test_dumps_analysis_json_numpy_values():
+    """Test serializing results that contain numpy scalars and arrays."""
+    results = {
+        "variable": "t2m",
+        "mean": np.float32(1.5),
+        "count": np.int64(3),
+        "values": np.array([1.0, 2.0]),
+    }
+
+    loaded_results = json.loads(dumps_analysis_json(results))
+    assert loaded_results["mean"] == 1.5
+    assert loaded_results["count"] == 3
+    assert loaded_results["values"] == [1.0, 2.0]
@@ -1,12 +1,18 @@
 """Tests for io module."""
 
+import io
+
 import numpy as np
 import pytest
+import xarray as xr
 
 from weather_data_tool.io import (
+    ZARR_V3_AVAILABLE,
+    _netcdf_encoding,
     get_variable_metadata,
     infer_coord_names,
     load_dataset,
+    load_ensemble,
     normalize_longitude,
     save_dataset,
     spatial_subset,
@@ -25,39 +31,80 @@ def test_infer_coord_names(sample_dataset_small):
 
 def test_infer_coord_names_alternative():
     """Test coordinate inference with alternative names."""
-    import xarray as xr
-
-    ds = xr.Dataset(
-        {
-            "temp": (["latitude", "longitude"], np.random.rand(5, 5)),
-        },
-        coords={
-            "latitude": np.arange(5),
-            "longitude": np.arange(5),
-        },
+    da = xr.DataArray(
+        np.empty((5, 5)),
+        dims=("latitude", "longitude"),
+        coords={"latitude": np.arange(5), "longitude": np.arange(5)},
     )
 
-    coord_names = infer_coord_names(ds)
+    coord_names = infer_coord_names(da)
     assert coord_names["lat"] == "latitude"
     assert coord_names["lon"] == "longitude"
 
 
 def test_normalize_longitude():
     """Test longitude normalization."""
-    import xarray as xr
-
-    # Create dataset with [0, 360] longitudes
+    # Create data array with [0, 360] longitudes
     lons_360 = np.array([0, 90, 180, 270, 359])
+    da = xr.DataArray(np.empty(5), dims="lon", coords={"lon": lons_360})
+
+    da_normalized = normalize_longitude(da, "lon")
+
+    # Check that longitudes are now in [-180, 180]
+    assert da_normalized.lon.min() >= -180
+    assert da_normalized.lon.max() <= 180
+
+
+def test_normalize_longitude_matches_sort():
+    """Test the rolled result matches modulo arithmetic plus sorting."""
+    lons_360 = np.arange(0.0, 360.0, 22.5)
     ds = xr.Dataset(
-        {"temp": (["lon"], np.random.rand(5))},
-        coords={"lon": lons_360},
+        {"temp": (["lat", "lon"], np.random.rand(3, lons_360.size))},
+        coords={"lat": [0.0, 1.0, 2.0], "lon": lons_360},
     )
 
     ds_normalized = normalize_longitude(ds, "lon")
+    expected = ds.assign_coords(lon=((ds.lon + 180) % 360) - 180).sortby("lon")
 
-    # Check that longitudes are now in [-180, 180]
-    assert ds_normalized.lon.min() >= -180
-    assert ds_normalized.lon.max() <= 180
+    xr.testing.assert_identical(ds_normalized, expected)
+
+    # Same grid with longitude as a non-dimension coordinate on 'x'
+    ds_x = ds.swap_dims({"lon": "x"})
+    ds_x_normalized = normalize_longitude(ds_x, "lon")
+
+    np.testing.assert_array_equal(ds_x_normalized.lon.values, expected.lon.values)
+    np.testing.assert_array_equal(ds_x_normalized.temp.values, expected.temp.values)
+
+
+def test_normalize_longitude_non_dimension_coord():
+    """Test a 1D longitude that is not a dimension coordinate."""
+    ds = xr.Dataset(
+        {"temp": (["x"], np.array([0.0, 1.0, 2.0, 3.0]))},
+        coords={"lon": (["x"], np.array([0.0, 90.0, 180.0, 270.0]))},
+    )
+
+    ds_normalized = normalize_longitude(ds, "lon")
+
+    np.testing.assert_array_equal(ds_normalized.lon.values, [-180.0, -90.0, 0.0, 90.0])
+    np.testing.assert_array_equal(ds_normalized.temp.values, [2.0, 3.0, 0.0, 1.0])
+
+
+def test_normalize_longitude_rotated_grid():
+    """Test a grid that does not start at 0 is still normalized by a roll."""
+    lons = np.concatenate([np.arange(90.0, 360.0, 30.0), np.arange(0.0, 90.0, 30.0)])
+    ds = xr.Dataset({"temp": (["lon"], np.random.rand(lons.size))}, coords={"lon": lons})
+
+    ds_normalized = normalize_longitude(ds, "lon")
+    expected = ds.assign_coords(lon=((ds.lon + 180) % 360) - 180).sortby("lon")
+
+    xr.testing.assert_identical(ds_normalized, expected)
+
+    # Same grid with longitude as a non-dimension coordinate on 'x'
+    ds_x = ds.swap_dims({"lon": "x"})
+    ds_x_normalized = normalize_longitude(ds_x, "lon")
+
+    np.testing.assert_array_equal(ds_x_normalized.lon.values, expected.lon.values)
+    np.testing.assert_array_equal(ds_x_normalized.temp.values, expected.temp.values)
 
 
 def test_spatial_subset(sample_dataset_medium):
@@ -86,6 +133,43 @@ def test_spatial_subset(sample_dataset_medium):
     assert "u10" in ds_subset
 
 
+def test_spatial_subset_native_0_360():
+    """Test a [0, 360] request on a [0, 360] source is selected natively."""
+    ds = xr.Dataset(
+        {"temp": (["lat", "lon"], np.random.rand(3, 36))},
+        coords={"lat": [40.0, 45.0, 50.0], "lon": np.arange(0.0, 360.0, 10.0)},
+    )
+
+    ds_subset = spatial_subset(ds, lat_min=40.0, lat_max=50.0, lon_min=200.0, lon_max=260.0)
+
+    np.testing.assert_array_equal(ds_subset.lon.values, np.arange(200.0, 270.0, 10.0))
+
+
+def test_dataset_roundtrip_in_memory(sample_dataset_with_time):
+    """Test save_dataset's NetCDF encoding keeps values, without touching disk."""
+    pytest.importorskip("h5netcdf")
+
+    encoding = _netcdf_encoding(sample_dataset_with_time, True, 4, "zlib")
+    assert encoding["t2m"]["dtype"] == "float32"
+    assert encoding["t2m"]["chunksizes"] == (5, 10, 10)
+
+    buffer = io.BytesIO()
+    sample_dataset_with_time.to_netcdf(buffer, engine="h5netcdf", encoding=encoding)
+
+    buffer.seek(0)
+    with xr.open_dataset(buffer, engine="h5netcdf") as ds_loaded:
+        np.testing.assert_allclose(
+            ds_loaded.t2m.values,
+            sample_dataset_with_time.t2m.values,
+            rtol=1e-5,
+        )
+        np.testing.assert_allclose(ds_loaded.lat.values, sample_dataset_with_time.lat.values)
+        assert ds_loaded.t2m.encoding["zlib"] is True
+        assert ds_loaded.t2m.encoding["shuffle"] is True
+        assert ds_loaded.t2m.encoding["chunksizes"] == (5, 10, 10)
+
+
+@pytest.mark.slow
 def test_save_and_load_dataset(sample_dataset_small, tmp_output_dir):
     """Test saving and loading datasets."""
     output_file = tmp_output_dir / "test_dataset.nc"
@@ -99,17 +183,22 @@ def test_save_and_load_dataset(sample_dataset_small, tmp_output_dir):
     # Load
     ds_loaded = load_dataset(output_file)
 
-    # Check data is the same
+    # Check data is the same (and was opened lazily); t2m is stored as float32
     assert "t2m" in ds_loaded
+    assert ds_loaded.t2m.chunks is not None
     np.testing.assert_allclose(
         ds_loaded.t2m.values,
         sample_dataset_small.t2m.values,
         rtol=1e-5,
     )
 
-    # Check coordinates
-    np.testing.assert_allclose(ds_loaded.lat.values, sample_dataset_small.lat.values)
-    np.testing.assert_allclose(ds_loaded.lon.values, sample_dataset_small.lon.values)
+    # Check coordinates (written losslessly)
+    assert np.array_equal(ds_loaded.lat.values, sample_dataset_small.lat.values)
+    assert np.array_equal(ds_loaded.lon.values, sample_dataset_small.lon.values)
+
+    # Check compression filters
+    assert ds_loaded.t2m.encoding["zlib"] is True
+    assert ds_loaded.t2m.encoding["shuffle"] is True
 
 
 def test_save_dataset_no_compression(sample_dataset_small, tmp_output_dir):
@@ -121,12 +210,85 @@ def test_save_dataset_no_compression(sample_dataset_small, tmp_output_dir):
     assert output_file.exists()
 
 
+def test_save_dataset_zstd(sample_dataset_with_time, tmp_output_dir):
+    """Test saving with a faster codec keeps values and uses chunking."""
+    nc4 = pytest.importorskip("netCDF4")
+    if not getattr(nc4, "__has_zstandard_support__", False):
+        pytest.skip("netCDF library built without Zstandard support")
+
+    output_file = tmp_output_dir / "test_zstd.nc"
+    save_dataset(sample_dataset_with_time, output_file, codec="zstd")
+
+    ds_loaded = load_dataset(output_file)
+    np.testing.assert_allclose(
+        ds_loaded.t2m.values,
+        sample_dataset_with_time.t2m.values,
+        rtol=1e-5,
+    )
+    assert ds_loaded.t2m.encoding["zstd"] is True
+    assert ds_loaded.t2m.encoding["chunksizes"] == (5, 10, 10)
+
+
+def test_save_dataset_unknown_codec(sample_dataset_small, tmp_output_dir):
+    """Test error handling for an unknown compression codec."""
+    with pytest.raises(ValueError, match="Unknown compression codec"):
+        save_dataset(sample_dataset_small, tmp_output_dir / "bad.nc", codec="lzma")
+
+
+def test_save_dataset_zarr_ignores_codec(sample_dataset_small, tmp_output_dir):
+    """Test the NetCDF codec is not validated for Zarr output, which ignores it."""
+    if not ZARR_V3_AVAILABLE:
+        pytest.skip("Zarr output requires zarr>=3.0")
+
+    output_store = tmp_output_dir / "codec.zarr"
+    save_dataset(sample_dataset_small, output_store, codec="lzma")
+
+    assert output_store.is_dir()
+
+
+def test_save_dataset_zarr(sample_dataset_with_time, tmp_output_dir):
+    """Test saving a sharded Zarr store inferred from the path suffix."""
+    if not ZARR_V3_AVAILABLE:
+        pytest.skip("Zarr output requires zarr>=3.0")
+
+    output_store = tmp_output_dir / "test_dataset.zarr"
+    save_dataset(sample_dataset_with_time, output_store)
+
+    ds_loaded = xr.open_zarr(output_store)
+    np.testing.assert_allclose(
+        ds_loaded.t2m.values,
+        sample_dataset_with_time.t2m.values,
+        rtol=1e-5,
+    )
+    assert ds_loaded.t2m.encoding["chunks"] == (1, 10, 10)
+    assert ds_loaded.t2m.encoding["shards"] == (1, 10, 10)
+
+
 def test_load_nonexistent_file(tmp_output_dir):
     """Test loading a file that doesn't exist."""
     with pytest.raises(FileNotFoundError):
         load_dataset(tmp_output_dir / "nonexistent.nc")
 
 
+def test_load_ensemble(sample_datasets_ensemble, tmp_output_dir):
+    """Test loading several files stacked along a model dimension."""
+    paths = []
+    for i, ds in enumerate(sample_datasets_ensemble):
+        path = tmp_output_dir / f"member_{i}.nc"
+        save_dataset(ds, path)
+        paths.append(path)
+
+    ensemble = load_ensemble(paths)
+
+    assert ensemble.sizes["model"] == len(sample_datasets_ensemble)
+    assert ensemble["t2m"].chunks is not None  # Opened lazily
+    np.testing.assert_allclose(
+        ensemble["t2m"].isel(model=1).values,
+        sample_datasets_ensemble[1]["t2m"].values,
+        rtol=1e-5,
+    )
+
+
 def test_get_variable_metadata(sample_dataset_small):
     """Test extracting variable metadata."""
     metadata = get_variable_metadata(sample_dataset_small, "t2m")
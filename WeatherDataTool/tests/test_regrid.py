@@ -4,6 +4,8 @@ import numpy as np
 import pytest
 
 from weather_data_tool.regrid import (
+    _REGRIDDER_CACHE,
+    _grid_key,
     create_reference_grid,
     get_grid_from_config,
     prepare_dataset_for_regridding,
@@ -39,6 +41,22 @@ def test_create_reference_grid():
     assert grid.lon.max() <= 10.0
 
 
+def test_create_reference_grid_point_count():
+    """Test the point count is exact despite inexact float resolution."""
+    grid = create_reference_grid(
+        lat_min=30.0,
+        lat_max=72.0,
+        lon_min=-25.0,
+        lon_max=45.0,
+        resolution=0.1,
+    )
+
+    assert len(grid.lat) == 421
+    assert len(grid.lon) == 701
+    assert float(grid.lat[-1]) == pytest.approx(72.0)
+    assert float(grid.lon[-1]) == pytest.approx(45.0)
+
+
 def test_get_grid_from_config(sample_config):
     """Test creating grid from configuration."""
     grid = get_grid_from_config(sample_config, "test_grid", "test_region")
@@ -71,6 +89,15 @@ def test_prepare_dataset_for_regridding(sample_dataset_small):
     assert "lon" in coord_names
 
 
+def test_prepare_dataset_keep_vars(sample_dataset_medium):
+    """Test unused variables are dropped before regridding."""
+    ds_prep, _ = prepare_dataset_for_regridding(sample_dataset_medium, keep_vars=["t2m"])
+
+    assert list(ds_prep.data_vars) == ["t2m"]
+    assert "lat" in ds_prep.coords
+    assert "lon" in ds_prep.coords
+
+
 def test_regrid_dataset(sample_dataset_small, reference_grid_small):
     """Test regridding a dataset."""
     ds_regridded = regrid_dataset(
@@ -107,6 +134,56 @@ def test_regrid_dataset_nearest(sample_dataset_small, reference_grid_small):
     assert ds_regridded.attrs["regrid_method"] == "nearest_s2d"
 
 
+def test_regrid_dataset_float32(sample_dataset_small, reference_grid_small):
+    """Test float64 inputs are regridded in float32."""
+    ds_regridded = regrid_dataset(sample_dataset_small, reference_grid_small)
+
+    assert ds_regridded.t2m.dtype == np.float32
+
+
+def test_regrid_dataset_with_time(sample_dataset_with_time, reference_grid_small):
+    """Test regridding a time series tile by tile keeps it in memory."""
+    ds_regridded = regrid_dataset(sample_dataset_with_time, reference_grid_small)
+
+    assert ds_regridded.sizes["time"] == sample_dataset_with_time.sizes["time"]
+    assert len(ds_regridded.lat) == len(reference_grid_small.lat)
+    assert ds_regridded.t2m.chunks is None
+
+
+def test_regrid_dataset_multiple_variables(sample_dataset_medium, reference_grid_small):
+    """Test variables regridded together keep their values and attributes."""
+    ds_regridded = regrid_dataset(sample_dataset_medium, reference_grid_small)
+    ds_single = regrid_dataset(sample_dataset_medium, reference_grid_small, variables=["u10"])
+
+    assert set(ds_regridded.data_vars) == set(sample_dataset_medium.data_vars)
+    assert "_var" not in ds_regridded.dims
+    assert ds_regridded["tp"].attrs["units"] == "mm"
+    np.testing.assert_allclose(ds_regridded["u10"].values, ds_single["u10"].values)
+
+
+def test_regrid_dataset_reuses_regridder(sample_dataset_small, reference_grid_small):
+    """Test the regridder is built once for repeated calls on the same grids."""
+    _REGRIDDER_CACHE.clear()
+
+    first = regrid_dataset(sample_dataset_small, reference_grid_small)
+    second = regrid_dataset(sample_dataset_small, reference_grid_small)
+
+    assert len(_REGRIDDER_CACHE) == 1
+    np.testing.assert_array_equal(first.t2m.values, second.t2m.values)
+
+
+def test_grid_key_uses_digest(sample_dataset_small):
+    """Test grid keys hold fixed-size digests rather than coordinate values."""
+    ds_prep, _ = prepare_dataset_for_regridding(sample_dataset_small)
+    ds_shifted = ds_prep.assign_coords(lon=ds_prep.lon + 1.0)
+
+    key = _grid_key(ds_prep)
+
+    assert key == _grid_key(ds_prep.copy(deep=True))
+    assert key != _grid_key(ds_shifted)
+    assert all(len(digest) == 32 for *_, digest in key)
+
+
 def test_regrid_to_common_grid(sample_datasets_ensemble, reference_grid_small):
     """Test regridding multiple datasets to common grid."""
     datasets_regridded = regrid_to_common_grid(
@@ -134,14 +211,53 @@ def test_regrid_to_common_grid(sample_datasets_ensemble, reference_grid_small):
         )
 
 
+def test_regrid_to_common_grid_shared_regridder(
+    sample_datasets_ensemble, reference_grid_small, regrid_weights
+):
+    """Test a prebuilt regridder is applied to every dataset."""
+    _REGRIDDER_CACHE.clear()
+
+    datasets_regridded = regrid_to_common_grid(
+        sample_datasets_ensemble,
+        reference_grid_small,
+        regridder=regrid_weights,
+    )
+
+    assert len(_REGRIDDER_CACHE) == 0
+    for ds in datasets_regridded:
+        assert len(ds.lat) == len(reference_grid_small.lat)
+        assert len(ds.lon) == len(reference_grid_small.lon)
+        assert ds.attrs["regrid_method"] == regrid_weights.method
+
+
+def test_regrid_to_common_grid_shared_regridder_wrong_grid(
+    sample_datasets_ensemble, sample_dataset_medium, reference_grid_small, regrid_weights
+):
+    """Test a prebuilt regridder is rejected for datasets on other grids."""
+    with pytest.raises(ValueError, match="share one grid"):
+        regrid_to_common_grid(
+            [sample_datasets_ensemble[0], sample_dataset_medium],
+            reference_grid_small,
+            regridder=regrid_weights,
+        )
+
+    with pytest.raises(ValueError, match="does not match"):
+        regrid_to_common_grid(
+            [sample_dataset_medium],
+            reference_grid_small,
+            regridder=regrid_weights,
+        )
+
+
 def test_regrid_preserves_attributes(sample_dataset_small, reference_grid_small):
     """Test that regridding preserves important attributes."""
-    # Add some custom attributes
-    sample_dataset_small.attrs["model"] = "TEST_MODEL"
-    sample_dataset_small["t2m"].attrs["custom_attr"] = "test_value"
+    # Add some custom attributes to a copy of the shared fixture
+    ds = sample_dataset_small.copy()
+    ds.attrs = {**ds.attrs, "model": "TEST_MODEL"}
+    ds["t2m"].attrs = {**ds["t2m"].attrs, "custom_attr": "test_value"}
 
     ds_regridded = regrid_dataset(
-        sample_dataset_small,
+        ds,
         reference_grid_small,
         method="bilinear",
     )
@@ -33,6 +33,20 @@ def test_parse_datetime_with_z():
     assert dt.year == 2024
 
 
+@pytest.mark.parametrize(
+    "dt_str",
+    [
+        "2024-01-15T12:00:00Z",
+        "2024-01-15T12:00:00+00:00",
+        "2024-01-15T14:00:00+02:00",
+        "2024-01-15T07:00:00-05:00",
+    ],
+)
+def test_parse_datetime_offsets(dt_str):
+    """Test strings with a UTC offset are converted to naive UTC."""
+    assert parse_datetime(dt_str) == datetime(2024, 1, 15, 12)
+
+
 def test_parse_datetime_none():
     """Test parsing None."""
     dt = parse_datetime(None)
@@ -74,28 +88,32 @@ def test_validate_bounds_valid():
     validate_bounds(0, 45, 0, 90)
 
 
-def test_validate_bounds_invalid_lat():
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        (-100, 60, -20, 40),
+        (30, 100, -20, 40),
+        (60, 30, -20, 40),  # lat_min > lat_max
+    ],
+)
+def test_validate_bounds_invalid_lat(bounds):
     """Test invalid latitude bounds."""
     with pytest.raises(ValueError, match="Invalid latitude"):
-        validate_bounds(-100, 60, -20, 40)
+        validate_bounds(*bounds)
 
-    with pytest.raises(ValueError, match="Invalid latitude"):
-        validate_bounds(30, 100, -20, 40)
-
-    with pytest.raises(ValueError, match="Invalid latitude"):
-        validate_bounds(60, 30, -20, 40)  # lat_min > lat_max
 
-
-def test_validate_bounds_invalid_lon():
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        (30, 60, -200, 40),
+        (30, 60, -20, 400),
+        (30, 60, 40, 20),  # lon_min > lon_max
+    ],
+)
+def test_validate_bounds_invalid_lon(bounds):
     """Test invalid longitude bounds."""
     with pytest.raises(ValueError, match="Invalid longitude"):
-        validate_bounds(30, 60, -200, 40)
-
-    with pytest.raises(ValueError, match="Invalid longitude"):
-        validate_bounds(30, 60, -20, 400)
-
-    with pytest.raises(ValueError, match="Invalid longitude"):
-        validate_bounds(30, 60, 40, 20)  # lon_min > lon_max
+        validate_bounds(*bounds)
 
 
 def test_ensure_dir(tmp_path):